@@ -4,10 +4,17 @@ Full Automation Launch File for TurtleBot3
 Launches complete automation system with simulation, navigation, detection, and voice control
 """
 
-import os
 from launch import LaunchDescription
-from launch.actions import DeclareLaunchArgument, ExecuteProcess, IncludeLaunchDescription
+from launch.actions import (
+    DeclareLaunchArgument,
+    ExecuteProcess,
+    GroupAction,
+    IncludeLaunchDescription,
+    RegisterEventHandler,
+    SetEnvironmentVariable,
+)
 from launch.conditions import IfCondition
+from launch.event_handlers import OnProcessExit
 from launch.substitutions import LaunchConfiguration, PathJoinSubstitution
 from launch_ros.actions import Node
 from launch_ros.substitutions import FindPackageShare
@@ -47,14 +54,18 @@ def generate_launch_description():
         description='TurtleBot3 model (burger, waffle, waffle_pi)'
     )
     
-    # Set environment variables
-    os.environ['TURTLEBOT3_MODEL'] = LaunchConfiguration('robot_model').perform(None)
+    # Set environment variables (resolved by the launch service, honours CLI overrides)
+    robot_model_env = SetEnvironmentVariable(
+        'TURTLEBOT3_MODEL',
+        LaunchConfiguration('robot_model')
+    )
     
     # Find package directories
     pkg_gazebo_ros = FindPackageShare('gazebo_ros')
     pkg_turtlebot3_gazebo = FindPackageShare('turtlebot3_gazebo')
     pkg_turtlebot3_navigation2 = FindPackageShare('turtlebot3_navigation2')
     pkg_turtlebot3_simulations = FindPackageShare('turtlebot3_simulations')
+    pkg_turtlebot_automation = FindPackageShare('turtlebot_automation')
     
     # Gazebo launch
     gazebo_launch = IncludeLaunchDescription(
@@ -84,7 +95,7 @@ def generate_launch_description():
             'use_sim_time': LaunchConfiguration('use_sim_time'),
             'map': '',
             'params_file': PathJoinSubstitution([
-                FindPackageShare('turtlebot_automation'),
+                pkg_turtlebot_automation,
                 'config',
                 'nav2_params.yaml'
             ])
@@ -102,13 +113,32 @@ def generate_launch_description():
         launch_arguments={
             'use_sim_time': LaunchConfiguration('use_sim_time'),
             'rviz_config': PathJoinSubstitution([
-                FindPackageShare('turtlebot_automation'),
+                pkg_turtlebot_automation,
                 'config',
                 'turtlebot3_view.rviz'
             ])
         }.items()
     )
     
+    # Gazebo is an included description with no single process to hook, so
+    # readiness is observed directly: this exits once /clock is published
+    wait_for_clock = ExecuteProcess(
+        cmd=['ros2', 'topic', 'echo', '--once', '/clock'],
+        name='wait_for_clock',
+        output='log'
+    )
+    
+    # Nav2 and RViz start as soon as the clock runs instead of after a fixed
+    # delay; a killed wait (launch shutting down) starts nothing
+    start_after_clock = RegisterEventHandler(
+        OnProcessExit(
+            target_action=wait_for_clock,
+            on_exit=lambda event, context: (
+                [navigation_launch, rviz_launch] if event.returncode == 0 else None
+            )
+        )
+    )
+    
     # Camera bridge for Gazebo
     camera_bridge = Node(
         package='ros_gz_image',
@@ -129,7 +159,7 @@ def generate_launch_description():
             {'use_sim_time': LaunchConfiguration('use_sim_time')},
             {'simulation_mode': True},
             {'config_file': PathJoinSubstitution([
-                FindPackageShare('turtlebot_automation'),
+                pkg_turtlebot_automation,
                 'config',
                 'automation_config.yaml'
             ])}
@@ -183,12 +213,17 @@ def generate_launch_description():
         use_rviz_arg,
         world_name_arg,
         robot_model_arg,
+        robot_model_env,
         gazebo_launch,
-        navigation_launch,
-        rviz_launch,
-        camera_bridge,
-        automation_node,
-        detection_node,
-        voice_node,
-        maintenance_node
+        # Hold back the heavy stacks so Nav2 does not spin up its costmaps
+        # before Gazebo publishes /clock
+        wait_for_clock,
+        start_after_clock,
+        GroupAction([
+            camera_bridge,
+            automation_node,
+            detection_node,
+            voice_node,
+            maintenance_node
+        ])
     ])
\ No newline at end of file
@@ -5,34 +5,109 @@ Handles health monitoring, diagnostics, and system maintenance
 Supports both simulation and hardware deployment
 """
 
-import rclpy
 import time
 import threading
 import logging
+import numpy as np
 from typing import Dict, List, Optional
 from pathlib import Path
 
 # ROS2 imports
 try:
     from rclpy.node import Node
+    from rclpy.callback_groups import MutuallyExclusiveCallbackGroup, ReentrantCallbackGroup
+    from rclpy.executors import MultiThreadedExecutor
+    from rclpy.qos import QoSProfile, DurabilityPolicy, HistoryPolicy, ReliabilityPolicy, qos_profile_sensor_data
     from sensor_msgs.msg import BatteryState, Imu, LaserScan
     from nav_msgs.msg import Odometry
     from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus
-    from std_msgs.msg import Header
+    from std_msgs.msg import Bool, Header
 except ImportError:
     # Fallback for systems without ROS2 installed
     Node = object
+    MutuallyExclusiveCallbackGroup = object
+    ReentrantCallbackGroup = object
+    MultiThreadedExecutor = object
+    QoSProfile = object
+    DurabilityPolicy = object
+    HistoryPolicy = object
+    ReliabilityPolicy = object
+    qos_profile_sensor_data = None
     BatteryState = object
     Imu = object
     LaserScan = object
     Odometry = object
     DiagnosticArray = object
     DiagnosticStatus = object
+    Bool = object
     Header = object
 
+_ROS2_AVAILABLE = Node is not object
 
-class MaintenanceAutomation(Node if 'Node' in globals() else object):
-    """Automates health monitoring and maintenance for TurtleBot3"""
+# System monitoring imports
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    psutil = None
+
+# Packed record holding the numeric health metrics; float64 so health
+# reports carry the measured values without float32 rounding noise
+_HEALTH_METRICS_DTYPE = np.dtype([
+    ('battery_voltage', np.float64),
+    ('battery_pct', np.float64),
+    ('left_wheel', np.float64),
+    ('right_wheel', np.float64),
+    ('cpu_usage', np.float64),
+    ('memory_usage', np.float64),
+    ('disk_usage', np.float64),
+])
+
+# Initial health state reported in simulation mode
+_SIMULATION_HEALTH_DEFAULTS = (
+    ('_battery_status', 'ok'),
+    ('_lidar_status', 'ok'),
+    ('_imu_status', 'ok'),
+    ('_camera_status', 'ok'),
+    ('_motor_status', 'ok'),
+    ('_navigation_status', 'ok'),
+    ('_localization_status', 'ok'),
+)
+_SIMULATION_METRIC_DEFAULTS = (
+    ('battery_voltage', 11.8),
+    ('battery_pct', 85.0),
+    ('left_wheel', 0.0),
+    ('right_wheel', 0.0),
+)
+
+# Sensor status fields that mock data generation may perturb
+_MOCK_SENSOR_ATTRS = ('_lidar_status', '_imu_status', '_camera_status')
+
+
+class MaintenanceAutomation:
+    """Automates health monitoring and maintenance for TurtleBot3
+
+    The ROS2 node is held by composition (``self.node``) rather than
+    inheritance so the class can declare ``__slots__``.
+    """
+
+    __slots__ = (
+        'node', 'config', 'logger',
+        'health_check_interval', 'battery_threshold',
+        'is_monitoring', 'monitoring_thread', 'diagnostics_publish_period',
+        '_health_timer', '_diagnostics_timer',
+        '_battery_status', '_battery_sensor_status', '_lidar_status',
+        '_imu_status', '_camera_status', '_motor_status',
+        '_navigation_status', '_localization_status', '_metrics',
+        '_last_battery_time', '_last_lidar_time', '_last_imu_time',
+        '_last_odom_time', '_start_time',
+        'lidar_min_valid_fraction', '_lidar_ok', '_rng',
+        '_disk_check_every', '_system_check_count',
+        'battery_sub', 'imu_sub', 'lidar_sub', 'odom_sub', 'diagnostic_pub',
+        'health_pub', '_health_msg', '_diagnostic_msg', '_battery_diag', '_sensor_diags',
+        '_sensor_cbg', '_monitor_cbg', '_diagnostics_cbg',
+    )
     
     def __init__(self, config: Dict):
         """
@@ -42,8 +117,7 @@ class MaintenanceAutomation(Node if 'Node' in globals() else object):
             config: Configuration dictionary
         """
         # Initialize ROS node if available
-        if 'Node' in globals():
-            super().__init__('maintenance_automation')
+        self.node = Node('maintenance_automation') if _ROS2_AVAILABLE else None
             
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -55,13 +129,43 @@ class MaintenanceAutomation(Node if 'Node' in globals() else object):
         # State tracking
         self.is_monitoring = False
         self.monitoring_thread = None
-        self.system_health = {
-            'battery': {'status': 'unknown', 'voltage': 0.0, 'percentage': 100.0},
-            'sensors': {'lidar': 'unknown', 'imu': 'unknown', 'camera': 'unknown'},
-            'motors': {'status': 'unknown', 'left_wheel': 0.0, 'right_wheel': 0.0},
-            'navigation': {'status': 'unknown', 'localization': 'unknown'},
-            'system': {'cpu_usage': 0.0, 'memory_usage': 0.0, 'disk_usage': 0.0}
-        }
+        self.diagnostics_publish_period = 1.0
+        self._health_timer = None
+        self._diagnostics_timer = None
+
+        # Health state is kept as flat fields: callbacks only perform single
+        # writes (atomic under the GIL) and readers compose a snapshot via
+        # _health_snapshot(), so no lock is needed on the hot path.
+        # Status strings are plain attributes; numeric metrics share one
+        # packed float64 record instead of individual Python floats.
+        self._battery_status = 'unknown'
+        self._battery_sensor_status = 'unknown'
+        self._lidar_status = 'unknown'
+        self._imu_status = 'unknown'
+        self._camera_status = 'unknown'
+        self._motor_status = 'unknown'
+        self._navigation_status = 'unknown'
+        self._localization_status = 'unknown'
+        self._metrics = np.zeros((), dtype=_HEALTH_METRICS_DTYPE)
+        self._metrics['battery_pct'] = 100.0
+
+        # Monotonic time of the most recent message per source; 0.0 means never received
+        self._last_battery_time = 0.0
+        self._last_lidar_time = 0.0
+        self._last_imu_time = 0.0
+        self._last_odom_time = 0.0
+        self._start_time = 0.0
+
+        # LIDAR scans with fewer valid returns than this fraction count as failed
+        self.lidar_min_valid_fraction = 0.05
+        self._lidar_ok = True
+
+        # Random source for mock sensor data
+        self._rng = np.random.default_rng()
+
+        # Disk usage changes slowly, so only refresh it every N health checks
+        self._disk_check_every = 10
+        self._system_check_count = 0
         
         # ROS2 subscribers (will be initialized in initialize())
         self.battery_sub = None
@@ -69,13 +173,29 @@ class MaintenanceAutomation(Node if 'Node' in globals() else object):
         self.lidar_sub = None
         self.odom_sub = None
         self.diagnostic_pub = None
+        self.health_pub = None
+        self._health_msg = None
+
+        # Reusable diagnostics message (built in _setup_ros_connections())
+        self._diagnostic_msg = None
+        self._battery_diag = None
+        self._sensor_diags = ()
+
+        # Sensor callbacks only record timestamps, so let them run concurrently
+        # instead of queueing behind diagnostics on the default callback group
+        self._sensor_cbg = ReentrantCallbackGroup() if _ROS2_AVAILABLE else None
+        self._monitor_cbg = ReentrantCallbackGroup() if _ROS2_AVAILABLE else None
+        # The diagnostics timer refills the shared _diagnostic_msg, so an
+        # overrunning tick must not overlap the next one
+        self._diagnostics_cbg = MutuallyExclusiveCallbackGroup() if _ROS2_AVAILABLE else None
         
     def initialize(self) -> bool:
         """Initialize maintenance module"""
         try:
             self.logger.info("Initializing maintenance automation module")
+            self._prime_cpu_percent()
 
-            if 'Node' in globals():
+            if _ROS2_AVAILABLE:
                 self._setup_ros_connections()
                 self.logger.info("ROS2 connections established for maintenance monitoring")
             else:
@@ -84,163 +204,253 @@ class MaintenanceAutomation(Node if 'Node' in globals() else object):
 
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize maintenance module: {e}")
+            self.logger.error("Failed to initialize maintenance module: %s", e)
             return False
             
     def _setup_ros_connections(self) -> None:
         """Setup ROS2 subscribers and publishers"""
         try:
+            # LIDAR/IMU drivers publish best-effort sensor data; battery and
+            # odometry stay reliable with a bounded keep-last queue
+            state_qos = QoSProfile(
+                history=HistoryPolicy.KEEP_LAST,
+                depth=50,
+                reliability=ReliabilityPolicy.RELIABLE
+            )
+            diagnostics_qos = QoSProfile(history=HistoryPolicy.KEEP_LAST, depth=1000)
+
             # Battery status subscriber
-            self.battery_sub = self.create_subscription(
+            self.battery_sub = self.node.create_subscription(
                 BatteryState,
                 '/battery_status',
                 self._battery_callback,
-                10
+                state_qos,
+                callback_group=self._sensor_cbg
             )
 
             # IMU subscriber
-            self.imu_sub = self.create_subscription(
+            self.imu_sub = self.node.create_subscription(
                 Imu,
                 '/imu',
                 self._imu_callback,
-                10
+                qos_profile_sensor_data,
+                callback_group=self._sensor_cbg
             )
 
             # LIDAR subscriber
-            self.lidar_sub = self.create_subscription(
+            self.lidar_sub = self.node.create_subscription(
                 LaserScan,
                 '/scan',
                 self._lidar_callback,
-                10
+                qos_profile_sensor_data,
+                callback_group=self._sensor_cbg
             )
 
             # Odometry subscriber
-            self.odom_sub = self.create_subscription(
+            self.odom_sub = self.node.create_subscription(
                 Odometry,
                 '/odom',
                 self._odom_callback,
-                10
+                state_qos,
+                callback_group=self._sensor_cbg
             )
 
             # Diagnostics publisher
-            self.diagnostic_pub = self.create_publisher(
+            self.diagnostic_pub = self.node.create_publisher(
                 DiagnosticArray,
                 '/diagnostics',
-                10
+                diagnostics_qos,
+                callback_group=self._diagnostics_cbg
             )
 
+            self._build_diagnostics_template()
+
+            # Overall health verdict, published once per health check so
+            # consumers subscribe instead of polling is_healthy(); latched
+            # so late joiners get the last verdict immediately
+            self.health_pub = self.node.create_publisher(
+                Bool,
+                '/automation/health',
+                QoSProfile(
+                    history=HistoryPolicy.KEEP_LAST,
+                    depth=1,
+                    reliability=ReliabilityPolicy.RELIABLE,
+                    durability=DurabilityPolicy.TRANSIENT_LOCAL
+                )
+            )
+            self._health_msg = Bool()
+
             self.logger.info("ROS2 connections established")
 
         except Exception as e:
-            self.logger.error(f"Failed to setup ROS connections: {e}")
+            self.logger.error("Failed to setup ROS connections: %s", e)
+
+    def _build_diagnostics_template(self) -> None:
+        """Preallocate the diagnostics message; only level/message/stamp change per publish"""
+        self._diagnostic_msg = DiagnosticArray()
+        self._diagnostic_msg.header = Header()
+
+        self._battery_diag = DiagnosticStatus()
+        self._battery_diag.name = "turtlebot3_battery"
+        self._battery_diag.hardware_id = "battery"
+        self._diagnostic_msg.status.append(self._battery_diag)
+
+        sensor_diags = []
+        for sensor in ('lidar', 'imu', 'camera', 'battery'):
+            sensor_status = DiagnosticStatus()
+            sensor_status.name = f"turtlebot3_{sensor}"
+            sensor_status.hardware_id = sensor
+            self._diagnostic_msg.status.append(sensor_status)
+            attr = '_battery_sensor_status' if sensor == 'battery' else f'_{sensor}_status'
+            sensor_diags.append((attr, sensor_status, f"{sensor.capitalize()}: "))
+        self._sensor_diags = tuple(sensor_diags)
 
     def _start_simulation_mode(self) -> None:
         """Start simulation mode with mock data generation"""
         self.logger.info("Starting maintenance simulation mode")
-        # Initialize mock data
-        self._last_battery_time = time.time()
-        self._last_lidar_time = time.time()
-        self._last_imu_time = time.time()
-        self._last_odom_time = time.time()
+        # Mark mock sources as freshly received
+        now = time.monotonic()
+        self._last_battery_time = now
+        self._last_lidar_time = now
+        self._last_imu_time = now
+        self._last_odom_time = now
 
         # Set initial mock health status
-        self.system_health['battery']['voltage'] = 11.8
-        self.system_health['battery']['percentage'] = 85.0
-        self.system_health['battery']['status'] = 'ok'
-
-        self.system_health['sensors']['lidar'] = 'ok'
-        self.system_health['sensors']['imu'] = 'ok'
-        self.system_health['sensors']['camera'] = 'ok'
-
-        self.system_health['motors']['status'] = 'ok'
-        self.system_health['motors']['left_wheel'] = 0.0
-        self.system_health['motors']['right_wheel'] = 0.0
-
-        self.system_health['navigation']['status'] = 'ok'
-        self.system_health['navigation']['localization'] = 'ok'
+        for name, value in _SIMULATION_HEALTH_DEFAULTS:
+            setattr(self, name, value)
+        for name, value in _SIMULATION_METRIC_DEFAULTS:
+            self._metrics[name] = value
 
         self.logger.info("Maintenance simulation mode initialized with mock sensor data")
             
+    def start(self) -> None:
+        """Start health monitoring (AutomationModule interface)"""
+        self.start_monitoring()
+        
     def start_monitoring(self) -> None:
-        """Start health monitoring loop"""
+        """Start health monitoring"""
         if self.is_monitoring:
             self.logger.warning("Monitoring already started")
             return
             
         self.is_monitoring = True
-        self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitoring_thread.start()
+
+        if _ROS2_AVAILABLE:
+            # Health checks and diagnostics publishing run as executor timers so
+            # every callback (and every publish) stays on the executor threads
+            self._health_timer = self.node.create_timer(
+                self.health_check_interval,
+                self._on_health_tick,
+                callback_group=self._monitor_cbg
+            )
+            self._diagnostics_timer = self.node.create_timer(
+                self.diagnostics_publish_period,
+                self._publish_diagnostics,
+                callback_group=self._diagnostics_cbg
+            )
+        else:
+            self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
+            self.monitoring_thread.start()
         
         self.logger.info("Health monitoring started")
         
     def stop_monitoring(self) -> None:
         """Stop health monitoring"""
         self.is_monitoring = False
+
+        for timer in (self._health_timer, self._diagnostics_timer):
+            if timer is not None:
+                timer.cancel()
+                self.node.destroy_timer(timer)
+        self._health_timer = None
+        self._diagnostics_timer = None
+
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5.0)
             
         self.logger.info("Health monitoring stopped")
+
+    def _run_health_checks(self) -> None:
+        """Perform one round of health checks and log the result"""
+        # One clock read shared by every staleness check in this round
+        current_time = time.monotonic()
+        self._check_system_health()
+        self._check_sensor_health(current_time)
+        self._check_navigation_health(current_time)
+        self._log_health_status()
+        
+        healthy = self.is_healthy()
+        if self.health_pub is not None:
+            self._health_msg.data = healthy
+            self.health_pub.publish(self._health_msg)
+        if not healthy:
+            self.logger.warning("System health check failed")
+
+    def _on_health_tick(self) -> None:
+        """Health check timer callback"""
+        try:
+            self._run_health_checks()
+        except Exception as e:
+            self.logger.error("Error in health check: %s", e)
         
     def _monitoring_loop(self) -> None:
-        """Main monitoring loop"""
+        """Monitoring loop used when no ROS2 executor is available"""
+        # Sleep to absolute deadlines so check duration does not add to the period
+        next_tick = time.monotonic()
         while self.is_monitoring:
             try:
-                # Perform health checks
-                self._check_system_health()
-                self._check_sensor_health()
-                self._check_navigation_health()
-
-                # Publish diagnostics
-                if 'Node' in globals():
-                    self._publish_diagnostics()
-
-                # Log status
-                self._log_health_status()
+                # Perform health checks and log status
+                self._run_health_checks()
 
                 # Sleep until next check
-                time.sleep(self.health_check_interval)
+                next_tick += self.health_check_interval
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
 
             except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {e}")
+                self.logger.error("Error in monitoring loop: %s", e)
+                next_tick = time.monotonic() + 5.0
                 time.sleep(5.0)  # Brief pause before retry
 
     def _generate_mock_sensor_data(self) -> None:
         """Generate mock sensor data for simulation mode"""
-        import random
+        # Draw every random value needed this tick in one call:
+        # [sensor event, sensor ok, sensor index, motor event, left wheel, right wheel]
+        r = self._rng.random(6)
 
         # Simulate battery drain over time
-        current_time = time.time()
-        if hasattr(self, '_start_time'):
+        current_time = time.monotonic()
+        if self._start_time > 0.0:
             elapsed = current_time - self._start_time
             # Battery drains slowly over time
             battery_level = max(20.0, 100.0 - (elapsed / 3600.0) * 10.0)  # 10% per hour
-            self.system_health['battery']['percentage'] = battery_level
-            self.system_health['battery']['voltage'] = 11.8 * (battery_level / 100.0)
+            self._metrics['battery_pct'] = battery_level
+            self._metrics['battery_voltage'] = 11.8 * (battery_level / 100.0)
 
             if battery_level < self.battery_threshold:
-                self.system_health['battery']['status'] = 'low'
+                self._battery_status = 'low'
             else:
-                self.system_health['battery']['status'] = 'ok'
+                self._battery_status = 'ok'
         else:
             self._start_time = current_time
 
         # Simulate occasional sensor variations
-        if random.random() < 0.1:  # 10% chance
+        if r[0] < 0.1:  # 10% chance
             # Randomly vary sensor status
-            sensors = ['lidar', 'imu', 'camera']
-            sensor = random.choice(sensors)
-            if random.random() < 0.8:  # 80% chance of being ok
-                self.system_health['sensors'][sensor] = 'ok'
+            sensor_attr = _MOCK_SENSOR_ATTRS[int(r[2] * len(_MOCK_SENSOR_ATTRS))]
+            if r[1] < 0.8:  # 80% chance of being ok
+                setattr(self, sensor_attr, 'ok')
             else:
-                self.system_health['sensors'][sensor] = 'warning'
+                setattr(self, sensor_attr, 'warning')
 
         # Simulate motor activity
-        if random.random() < 0.3:  # 30% chance of movement
-            self.system_health['motors']['left_wheel'] = random.uniform(-0.5, 0.5)
-            self.system_health['motors']['right_wheel'] = random.uniform(-0.5, 0.5)
+        if r[3] < 0.3:  # 30% chance of movement
+            self._metrics['left_wheel'] = float(r[4]) - 0.5
+            self._metrics['right_wheel'] = float(r[5]) - 0.5
         else:
-            self.system_health['motors']['left_wheel'] = 0.0
-            self.system_health['motors']['right_wheel'] = 0.0
+            self._metrics['left_wheel'] = 0.0
+            self._metrics['right_wheel'] = 0.0
 
         # Update timestamps
         self._last_battery_time = current_time
@@ -248,185 +458,217 @@ class MaintenanceAutomation(Node if 'Node' in globals() else object):
         self._last_imu_time = current_time
         self._last_odom_time = current_time
                 
+    def _prime_cpu_percent(self) -> None:
+        """Seed psutil's CPU counters so later non-blocking reads are meaningful"""
+        if PSUTIL_AVAILABLE:
+            psutil.cpu_percent(interval=None)
+
     def _check_system_health(self) -> None:
         """Check system-level health metrics"""
+        if not PSUTIL_AVAILABLE:
+            # Fallback if psutil not available
+            self._metrics['cpu_usage'] = 0.0
+            self._metrics['memory_usage'] = 0.0
+            self._metrics['disk_usage'] = 0.0
+            return
+
         try:
-            import psutil
-            
-            # CPU usage
-            self.system_health['system']['cpu_usage'] = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous check (non-blocking)
+            self._metrics['cpu_usage'] = psutil.cpu_percent(interval=None)
             
             # Memory usage
             memory = psutil.virtual_memory()
-            self.system_health['system']['memory_usage'] = memory.percent
+            self._metrics['memory_usage'] = memory.percent
             
             # Disk usage
-            disk = psutil.disk_usage('/')
-            self.system_health['system']['disk_usage'] = (disk.used / disk.total) * 100
+            if self._system_check_count % self._disk_check_every == 0:
+                disk = psutil.disk_usage('/')
+                self._metrics['disk_usage'] = (disk.used / disk.total) * 100
+            self._system_check_count += 1
             
-        except ImportError:
-            # Fallback if psutil not available
-            self.system_health['system']['cpu_usage'] = 0.0
-            self.system_health['system']['memory_usage'] = 0.0
-            self.system_health['system']['disk_usage'] = 0.0
         except Exception as e:
-            self.logger.error(f"Error checking system health: {e}")
+            self.logger.error("Error checking system health: %s", e)
             
-    def _check_sensor_health(self) -> None:
-        """Check sensor health status"""
+    def _check_sensor_health(self, current_time: float) -> None:
+        """Check sensor health status
+
+        Args:
+            current_time: Timestamp of the current health check round
+        """
         # In simulation, sensors are always healthy
         # In real deployment, this would check actual sensor data
-        current_time = time.time()
         
-        # Check if we've received recent sensor data
-        if hasattr(self, '_last_battery_time'):
-            if current_time - self._last_battery_time > 60:
-                self.system_health['sensors']['battery'] = 'error'
-            else:
-                self.system_health['sensors']['battery'] = 'ok'
+        # Check if we've received recent sensor data (each timestamp read once)
+        last_battery = self._last_battery_time
+        if last_battery == 0.0:
+            self._battery_sensor_status = 'unknown'
+        elif current_time - last_battery > 60:
+            self._battery_sensor_status = 'error'
         else:
-            self.system_health['sensors']['battery'] = 'unknown'
+            self._battery_sensor_status = 'ok'
             
-        if hasattr(self, '_last_lidar_time'):
-            if current_time - self._last_lidar_time > 10:
-                self.system_health['sensors']['lidar'] = 'error'
-            else:
-                self.system_health['sensors']['lidar'] = 'ok'
+        last_lidar = self._last_lidar_time
+        if last_lidar == 0.0:
+            self._lidar_status = 'unknown'
+        elif current_time - last_lidar > 10 or not self._lidar_ok:
+            self._lidar_status = 'error'
         else:
-            self.system_health['sensors']['lidar'] = 'unknown'
+            self._lidar_status = 'ok'
             
-        if hasattr(self, '_last_imu_time'):
-            if current_time - self._last_imu_time > 10:
-                self.system_health['sensors']['imu'] = 'error'
-            else:
-                self.system_health['sensors']['imu'] = 'ok'
+        last_imu = self._last_imu_time
+        if last_imu == 0.0:
+            self._imu_status = 'unknown'
+        elif current_time - last_imu > 10:
+            self._imu_status = 'error'
         else:
-            self.system_health['sensors']['imu'] = 'unknown'
+            self._imu_status = 'ok'
             
-    def _check_navigation_health(self) -> None:
-        """Check navigation system health"""
+    def _check_navigation_health(self, current_time: float) -> None:
+        """Check navigation system health
+
+        Args:
+            current_time: Timestamp of the current health check round
+        """
         # Check if navigation stack is responsive
-        current_time = time.time()
         
-        if hasattr(self, '_last_odom_time'):
-            if current_time - self._last_odom_time > 5:
-                self.system_health['navigation']['status'] = 'error'
-            else:
-                self.system_health['navigation']['status'] = 'ok'
+        if self._last_odom_time == 0.0:
+            self._navigation_status = 'unknown'
+        elif current_time - self._last_odom_time > 5:
+            self._navigation_status = 'error'
         else:
-            self.system_health['navigation']['status'] = 'unknown'
+            self._navigation_status = 'ok'
             
     def _battery_callback(self, msg: BatteryState) -> None:
         """Battery status callback"""
-        self._last_battery_time = time.time()
-        self.system_health['battery']['voltage'] = msg.voltage
-        self.system_health['battery']['percentage'] = msg.percentage
+        self._last_battery_time = time.monotonic()
+        self._metrics['battery_voltage'] = msg.voltage
+        self._metrics['battery_pct'] = msg.percentage
         
         if msg.percentage < self.battery_threshold:
-            self.logger.warning(f"Low battery: {msg.percentage:.1f}%")
-            self.system_health['battery']['status'] = 'low'
+            self.logger.warning("Low battery: %.1f%%", msg.percentage)
+            self._battery_status = 'low'
         else:
-            self.system_health['battery']['status'] = 'ok'
+            self._battery_status = 'ok'
             
     def _imu_callback(self, msg: Imu) -> None:
         """IMU data callback"""
-        self._last_imu_time = time.time()
+        self._last_imu_time = time.monotonic()
         
     def _lidar_callback(self, msg: LaserScan) -> None:
         """LIDAR scan callback"""
-        self._last_lidar_time = time.time()
+        self._last_lidar_time = time.monotonic()
         
-        # Check if LIDAR is providing valid data
-        if len(msg.ranges) > 0 and not all(r == 0.0 for r in msg.ranges):
-            self.system_health['sensors']['lidar'] = 'ok'
-        else:
-            self.system_health['sensors']['lidar'] = 'error'
+        # Check if enough beams return a valid range (vectorized, no per-range Python loop);
+        # the status itself is derived in _check_sensor_health()
+        ranges = np.asarray(msg.ranges, dtype=np.float32)
+        valid = np.count_nonzero(np.isfinite(ranges) & (ranges > 0.0))
+        self._lidar_ok = valid / max(ranges.size, 1) > self.lidar_min_valid_fraction
             
     def _odom_callback(self, msg: Odometry) -> None:
         """Odometry callback"""
-        self._last_odom_time = time.time()
+        self._last_odom_time = time.monotonic()
         
     def _publish_diagnostics(self) -> None:
         """Publish diagnostic information"""
         try:
-            diagnostic_msg = DiagnosticArray()
-            diagnostic_msg.header = Header()
-            diagnostic_msg.header.stamp = self.get_clock().now().to_msg()
+            diagnostic_msg = self._diagnostic_msg
+            diagnostic_msg.header.stamp = self.node.get_clock().now().to_msg()
             
             # Battery diagnostics
-            battery_status = DiagnosticStatus()
-            battery_status.name = "turtlebot3_battery"
-            battery_status.hardware_id = "battery"
-            battery_status.level = DiagnosticStatus.OK if self.system_health['battery']['status'] == 'ok' else DiagnosticStatus.WARN
-            battery_status.message = f"Battery: {self.system_health['battery']['percentage']:.1f}%"
-            diagnostic_msg.status.append(battery_status)
+            battery_status = self._battery_diag
+            battery_status.level = DiagnosticStatus.OK if self._battery_status == 'ok' else DiagnosticStatus.WARN
+            battery_status.message = f"Battery: {self._metrics['battery_pct']:.1f}%"
             
             # Sensor diagnostics
-            for sensor, status in self.system_health['sensors'].items():
-                sensor_status = DiagnosticStatus()
-                sensor_status.name = f"turtlebot3_{sensor}"
-                sensor_status.hardware_id = sensor
+            for attr, sensor_status, label in self._sensor_diags:
+                status = getattr(self, attr)
                 sensor_status.level = DiagnosticStatus.OK if status == 'ok' else DiagnosticStatus.ERROR
-                sensor_status.message = f"{sensor.capitalize()}: {status}"
-                diagnostic_msg.status.append(sensor_status)
+                sensor_status.message = label + status
                 
             self.diagnostic_pub.publish(diagnostic_msg)
             
         except Exception as e:
-            self.logger.error(f"Error publishing diagnostics: {e}")
+            self.logger.error("Error publishing diagnostics: %s", e)
             
     def _log_health_status(self) -> None:
         """Log current health status"""
-        battery = self.system_health['battery']
-        sensors = self.system_health['sensors']
-        system = self.system_health['system']
-        
         self.logger.info(
-            f"Health Status - Battery: {battery['percentage']:.1f}% ({battery['status']}), "
-            f"Sensors: LIDAR={sensors['lidar']}, IMU={sensors['imu']}, "
-            f"System: CPU={system['cpu_usage']:.1f}%, MEM={system['memory_usage']:.1f}%"
+            "Health Status - Battery: %.1f%% (%s), "
+            "Sensors: LIDAR=%s, IMU=%s, "
+            "System: CPU=%.1f%%, MEM=%.1f%%",
+            self._metrics['battery_pct'], self._battery_status,
+            self._lidar_status, self._imu_status,
+            self._metrics['cpu_usage'], self._metrics['memory_usage']
         )
         
     def is_healthy(self) -> bool:
         """Check if overall system is healthy"""
         # Check battery
-        if self.system_health['battery']['status'] in ['low', 'error']:
+        if self._battery_status in ('low', 'error'):
             return False
             
         # Check critical sensors
-        critical_sensors = ['lidar', 'imu']
-        for sensor in critical_sensors:
-            if self.system_health['sensors'][sensor] == 'error':
-                return False
+        if self._lidar_status == 'error' or self._imu_status == 'error':
+            return False
                 
         # Check system resources
-        system = self.system_health['system']
-        if system['cpu_usage'] > 90 or system['memory_usage'] > 90:
-            return False
-            
-        return True
+        return bool(self._metrics['cpu_usage'] <= 90 and self._metrics['memory_usage'] <= 90)
+
+    def _health_snapshot(self) -> Dict:
+        """Compose the nested health dictionary from the flat state fields"""
+        (battery_voltage, battery_pct, left_wheel, right_wheel,
+         cpu_usage, memory_usage, disk_usage) = self._metrics.item()
+        return {
+            'battery': {
+                'status': self._battery_status,
+                'voltage': battery_voltage,
+                'percentage': battery_pct
+            },
+            'sensors': {
+                'lidar': self._lidar_status,
+                'imu': self._imu_status,
+                'camera': self._camera_status,
+                'battery': self._battery_sensor_status
+            },
+            'motors': {
+                'status': self._motor_status,
+                'left_wheel': left_wheel,
+                'right_wheel': right_wheel
+            },
+            'navigation': {
+                'status': self._navigation_status,
+                'localization': self._localization_status
+            },
+            'system': {
+                'cpu_usage': cpu_usage,
+                'memory_usage': memory_usage,
+                'disk_usage': disk_usage
+            }
+        }
+
+    @property
+    def system_health(self) -> Dict:
+        """Point-in-time snapshot of the nested health state (read-only)"""
+        return self._health_snapshot()
         
     def get_health_report(self) -> Dict:
         """Get comprehensive health report"""
-        return {
-            'timestamp': time.time(),
-            'healthy': self.is_healthy(),
-            'battery': self.system_health['battery'],
-            'sensors': self.system_health['sensors'],
-            'motors': self.system_health['motors'],
-            'navigation': self.system_health['navigation'],
-            'system': self.system_health['system']
-        }
+        report = self._health_snapshot()
+        report['timestamp'] = time.time()
+        report['healthy'] = self.is_healthy()
+        return report
         
     def run(self) -> None:
         """Run maintenance monitoring (blocking)"""
         self.start_monitoring()
+        executor = MultiThreadedExecutor(num_threads=2)
+        executor.add_node(self.node)
         try:
-            while rclpy.ok():
-                rclpy.spin_once(self, timeout_sec=1.0)
+            executor.spin()
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt")
         finally:
+            executor.shutdown()
             self.stop_monitoring()
             
     def shutdown(self) -> None:
@@ -434,5 +676,5 @@ class MaintenanceAutomation(Node if 'Node' in globals() else object):
         self.logger.info("Shutting down maintenance automation")
         self.stop_monitoring()
         
-        if 'Node' in globals():
-            self.destroy_node()
\ No newline at end of file
+        if self.node is not None:
+            self.node.destroy_node()
\ No newline at end of file
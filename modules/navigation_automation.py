@@ -10,6 +10,8 @@ import time
 import threading
 import logging
 import math
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
@@ -17,6 +19,10 @@ from pathlib import Path
 try:
     from rclpy.node import Node
     from rclpy.action import ActionClient
+    from rclpy.callback_groups import MutuallyExclusiveCallbackGroup, ReentrantCallbackGroup
+    from rclpy.executors import SingleThreadedExecutor, ExternalShutdownException
+    from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy, HistoryPolicy
+    from rclpy.task import Future
     from geometry_msgs.msg import PoseStamped, PoseWithCovarianceStamped, Twist
     from nav_msgs.msg import OccupancyGrid, Odometry, Path
     from sensor_msgs.msg import LaserScan
@@ -27,6 +33,15 @@ except ImportError:
     # Fallback for systems without ROS2 installed
     Node = object
     ActionClient = object
+    MutuallyExclusiveCallbackGroup = object
+    ReentrantCallbackGroup = object
+    SingleThreadedExecutor = object
+    ExternalShutdownException = Exception
+    QoSProfile = object
+    Future = object
+    ReliabilityPolicy = object
+    DurabilityPolicy = object
+    HistoryPolicy = object
     PoseStamped = object
     PoseWithCovarianceStamped = object
     Twist = object
@@ -39,8 +54,16 @@ except ImportError:
     ManageLifecycleNodes = object
     Empty = object
 
+_ROS2_AVAILABLE = Node is not object
 
-class NavigationAutomation(Node if 'Node' in globals() else object):
+
+def _yaw_to_quat(yaw: float) -> Tuple[float, float]:
+    """Return the (z, w) quaternion components for a planar yaw angle"""
+    half = yaw * 0.5
+    return math.sin(half), math.cos(half)
+
+
+class NavigationAutomation(Node if _ROS2_AVAILABLE else object):
     """Automates navigation, SLAM, and path planning for TurtleBot3"""
     
     def __init__(self, config: Dict, simulation_mode: bool = True):
@@ -52,7 +75,7 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
             simulation_mode: True for simulation, False for hardware
         """
         # Initialize ROS node if available
-        if 'Node' in globals():
+        if _ROS2_AVAILABLE:
             super().__init__('navigation_automation')
             
         self.config = config
@@ -69,9 +92,20 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
         self.is_navigating = False
         self.navigation_active = False
         self.current_pose = None
-        self.current_map = None
+        # (OccupancyGrid, int8 array view) replaced as one tuple, so readers
+        # never pair a new message with the previous map's array
+        self._map = (None, None)
         self.goal_pose = None
         
+        # Set by stop_navigation() to wake simulated travel waits immediately
+        self._stop_event = threading.Event()
+        # Completed by stop_navigation() to end run()'s executor spin
+        self._spin_done = None
+        
+        # Simulated goals run one at a time on a single worker
+        self._sim_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='nav_sim')
+        self._sim_future = None
+        
         # ROS2 clients and subscribers
         self.nav_client = None
         self.waypoints_client = None
@@ -80,15 +114,20 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
         self.cmd_vel_pub = None
         self.initial_pose_pub = None
         
-        # Navigation thread
-        self.navigation_thread = None
+        # Shared all-zero command published by stop_robot(); never mutate it
+        self._zero_twist = Twist() if _ROS2_AVAILABLE else None
+        
+        # Executor that services this node's callbacks when run() owns the
+        # node; no extra thread is spawned. Created in run(), since the
+        # orchestrator spins the node on its own executor
+        self._executor = None
         
     def initialize(self) -> bool:
         """Initialize navigation module"""
         try:
             self.logger.info("Initializing navigation automation module")
 
-            if 'Node' in globals():
+            if _ROS2_AVAILABLE:
                 self._setup_ros_connections()
                 self.logger.info("ROS2 navigation connections established")
             else:
@@ -97,24 +136,51 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
 
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize navigation module: {e}")
+            self.logger.error("Failed to initialize navigation module: %s", e)
             return False
             
     def _setup_ros_connections(self) -> None:
         """Setup ROS2 action clients and subscribers"""
         try:
+            # Only the latest pose matters; never queue stale ones
+            pose_qos = QoSProfile(
+                reliability=ReliabilityPolicy.BEST_EFFORT,
+                history=HistoryPolicy.KEEP_LAST,
+                depth=1
+            )
+            # The map server latches /map, so subscribe transient-local to get it
+            map_qos = QoSProfile(
+                reliability=ReliabilityPolicy.RELIABLE,
+                durability=DurabilityPolicy.TRANSIENT_LOCAL,
+                history=HistoryPolicy.KEEP_LAST,
+                depth=1
+            )
+
+            # Goal responses must be able to run while another callback of
+            # this node waits on them; pose/map updates stay serialized in
+            # their own group so they never queue behind action traffic
+            action_cbg = ReentrantCallbackGroup()
+            state_cbg = MutuallyExclusiveCallbackGroup()
+            
             # Navigation action client
-            self.nav_client = ActionClient(self, NavigateToPose, 'navigate_to_pose')
+            self.nav_client = ActionClient(self, NavigateToPose, 'navigate_to_pose',
+                                           callback_group=action_cbg)
             
             # Waypoints action client
-            self.waypoints_client = ActionClient(self, FollowWaypoints, 'follow_waypoints')
+            self.waypoints_client = ActionClient(self, FollowWaypoints, 'follow_waypoints',
+                                                 callback_group=action_cbg)
             
-            # Pose subscriber
+            # Pose subscriber; a plain closure stores the message without
+            # going through a bound method at pose rate
+            def _store_pose(msg, _s=self):
+                _s.current_pose = msg
+                
             self.pose_sub = self.create_subscription(
                 PoseWithCovarianceStamped,
                 '/amcl_pose' if self.localization else '/odom',
-                self._pose_callback,
-                10
+                _store_pose,
+                pose_qos,
+                callback_group=state_cbg
             )
             
             # Map subscriber
@@ -122,7 +188,8 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
                 OccupancyGrid,
                 '/map',
                 self._map_callback,
-                10
+                map_qos,
+                callback_group=state_cbg
             )
             
             # Velocity publisher
@@ -138,7 +205,7 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
             self.logger.info("ROS2 navigation connections established")
 
         except Exception as e:
-            self.logger.error(f"Failed to setup ROS navigation connections: {e}")
+            self.logger.error("Failed to setup ROS navigation connections: %s", e)
 
     def _start_simulation_mode(self) -> None:
         """Start navigation simulation mode"""
@@ -151,40 +218,29 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
             'orientation': {'x': 0.0, 'y': 0.0, 'z': 0.0, 'w': 1.0}
         }
             
+    def start(self) -> None:
+        """Start the navigation system (AutomationModule interface)"""
+        self.start_navigation()
+        
     def start_navigation(self) -> None:
         """Start navigation system"""
         if self.navigation_active:
             self.logger.warning("Navigation already active")
             return
             
+        self._stop_event.clear()
         self.navigation_active = True
         self.logger.info("Navigation system started")
         
-        # Start navigation thread
-        self.navigation_thread = threading.Thread(target=self._navigation_loop, daemon=True)
-        self.navigation_thread.start()
-        
     def stop_navigation(self) -> None:
         """Stop navigation system"""
+        self._stop_event.set()
+        if self._spin_done is not None and not self._spin_done.done():
+            self._spin_done.set_result(True)
         self.navigation_active = False
         self.is_navigating = False
-        
-        if self.navigation_thread:
-            self.navigation_thread.join(timeout=5.0)
-            
         self.logger.info("Navigation system stopped")
         
-    def _navigation_loop(self) -> None:
-        """Main navigation loop"""
-        while self.navigation_active:
-            try:
-                if 'Node' in globals():
-                    rclpy.spin_once(self, timeout_sec=0.1)
-                time.sleep(0.1)
-            except Exception as e:
-                self.logger.error(f"Error in navigation loop: {e}")
-                time.sleep(1.0)
-                
     def navigate_to_pose(self, x: float, y: float, yaw: float = 0.0) -> bool:
         """
         Navigate to specific pose
@@ -197,7 +253,7 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
         Returns:
             True if navigation started successfully
         """
-        if not 'Node' in globals():
+        if not _ROS2_AVAILABLE:
             self.logger.warning("ROS2 not available, simulating navigation")
             return self._simulate_navigation(x, y, yaw)
             
@@ -216,44 +272,47 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
             goal_msg.pose.pose.position.y = y
             
             # Convert yaw to quaternion
-            goal_msg.pose.pose.orientation.z = math.sin(yaw / 2.0)
-            goal_msg.pose.pose.orientation.w = math.cos(yaw / 2.0)
+            qz, qw = _yaw_to_quat(yaw)
+            goal_msg.pose.pose.orientation.z = qz
+            goal_msg.pose.pose.orientation.w = qw
             
             # Send goal
             self.is_navigating = True
             self.goal_pose = (x, y, yaw)
             
             send_goal_future = self.nav_client.send_goal_async(goal_msg)
-            send_goal_future.add_done_callback(self._navigate_to_pose_response)
+            goal_handle = self._await_goal_handle(send_goal_future, "Navigation")
+            if goal_handle is None:
+                self.is_navigating = False
+                return False
+                
+            get_result_future = goal_handle.get_result_async()
+            get_result_future.add_done_callback(self._navigate_to_pose_result)
             
-            self.logger.info(f"Navigating to pose: x={x}, y={y}, yaw={yaw}")
+            self.logger.info("Navigating to pose: x=%s, y=%s, yaw=%s", x, y, yaw)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to navigate to pose: {e}")
+            self.logger.error("Failed to navigate to pose: %s", e)
             self.is_navigating = False
             return False
             
     def _simulate_navigation(self, x: float, y: float, yaw: float) -> bool:
         """Simulate navigation for testing without ROS2"""
-        import threading
-
-        self.logger.info(f"🚀 Starting navigation to pose: x={x:.2f}, y={y:.2f}, yaw={yaw:.2f} radians")
+        self.logger.info("🚀 Starting navigation to pose: x=%.2f, y=%.2f, yaw=%.2f radians", x, y, yaw)
 
         # Calculate navigation parameters
-        distance = math.sqrt(x**2 + y**2)
+        distance = math.hypot(x, y)
         nav_time = max(2.0, distance * 1.5)  # 1.5 seconds per meter, minimum 2 seconds
 
-        self.logger.info(f"📏 Distance to target: {distance:.2f} meters")
-        self.logger.info(f"⏱️  Estimated navigation time: {nav_time:.1f} seconds")
+        self.logger.info("📏 Distance to target: %.2f meters", distance)
+        self.logger.info("⏱️  Estimated navigation time: %.1f seconds", nav_time)
 
         self.is_navigating = True
         self.goal_pose = (x, y, yaw)
 
-        # Start simulation in background thread
-        nav_thread = threading.Thread(target=self._run_navigation_simulation, args=(x, y, yaw, nav_time))
-        nav_thread.daemon = True
-        nav_thread.start()
+        # Run the simulation on the navigation worker
+        self._sim_future = self._sim_pool.submit(self._run_navigation_simulation, x, y, yaw, nav_time)
 
         self.logger.info("🎯 Navigation goal accepted - robot is moving...")
         return True
@@ -262,11 +321,14 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
         """Run detailed navigation simulation"""
         import random
 
-        start_time = time.time()
-        steps = int(duration / 0.5)  # Update every 0.5 seconds
+        # Update every 0.5 seconds against absolute deadlines, so the pose
+        # work does not stretch the tick period
+        start_time = time.monotonic()
+        next_tick = start_time
+        steps = int(duration / 0.5)
 
         for step in range(steps):
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             progress = elapsed / duration
 
             if progress >= 1.0:
@@ -284,49 +346,70 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
             current_y += noise_y
 
             # Update mock pose
-            if hasattr(self, 'current_pose') and self.current_pose:
+            if self.current_pose:
                 self.current_pose['position']['x'] = current_x
                 self.current_pose['position']['y'] = current_y
 
             # Log progress
             if step % 4 == 0:  # Log every 2 seconds
-                self.logger.info(f"📍 Navigation progress: {progress*100:.1f}% - Position: ({current_x:.2f}, {current_y:.2f})")
+                self.logger.info("📍 Navigation progress: %.1f%% - Position: (%.2f, %.2f)", progress*100, current_x, current_y)
 
-            time.sleep(0.5)
+            next_tick += 0.5
+            if self._stop_event.wait(max(0.0, next_tick - time.monotonic())):
+                self.logger.info("Simulated navigation cancelled")
+                self.is_navigating = False
+                return
 
         # Navigation complete
-        self.logger.info(f"✅ Navigation completed! Final position: ({target_x:.2f}, {target_y:.2f})")
-        self.logger.info(f"🎯 Goal reached with {target_yaw:.2f} radian orientation")
+        self.logger.info("✅ Navigation completed! Final position: (%.2f, %.2f), "
+                         "orientation %.2f rad", target_x, target_y, target_yaw)
         self.is_navigating = False
         
-    def _navigate_to_pose_response(self, future) -> None:
-        """Handle navigation response"""
-        try:
-            goal_handle = future.result()
-            if not goal_handle.accepted:
-                self.logger.error("Navigation goal rejected")
-                self.is_navigating = False
-                return
-                
-            self.logger.info("Navigation goal accepted")
-            
-            get_result_future = goal_handle.get_result_async()
-            get_result_future.add_done_callback(self._navigate_to_pose_result)
+    def _await_goal_handle(self, send_goal_future, goal_name: str):
+        """
+        Spin the node's executor until the action server answers a goal request
+        
+        Args:
+            send_goal_future: Future returned by send_goal_async()
+            goal_name: Goal description used in log messages
             
-        except Exception as e:
-            self.logger.error(f"Error in navigation response: {e}")
-            self.is_navigating = False
+        Returns:
+            The accepted goal handle, or None if rejected or timed out
+        """
+        if self.executor is None:
+            # Nothing is spinning this node; spin it on the global executor
+            # for the wait
+            rclpy.spin_until_future_complete(self, send_goal_future, timeout_sec=10.0)
+        else:
+            # An executor (run()'s or the orchestrator's) is already spinning
+            # this node, and spinning it again here would re-enter it; just
+            # wait for it to deliver the response
+            answered = threading.Event()
+            send_goal_future.add_done_callback(lambda _: answered.set())
+            answered.wait(timeout=10.0)
+            
+        if not send_goal_future.done():
+            self.logger.error("%s goal response timed out", goal_name)
+            return None
+            
+        goal_handle = send_goal_future.result()
+        if not goal_handle.accepted:
+            self.logger.error("%s goal rejected", goal_name)
+            return None
+            
+        self.logger.info("%s goal accepted", goal_name)
+        return goal_handle
             
     def _navigate_to_pose_result(self, future) -> None:
         """Handle navigation result"""
         try:
             result = future.result().result
             if result:
-                self.logger.info(f"Navigation completed: {result}")
+                self.logger.info("Navigation completed: %s", result)
             else:
                 self.logger.warning("Navigation completed with no result")
         except Exception as e:
-            self.logger.error(f"Error in navigation result: {e}")
+            self.logger.error("Error in navigation result: %s", e)
         finally:
             self.is_navigating = False
             
@@ -340,7 +423,7 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
         Returns:
             True if waypoint following started successfully
         """
-        if not 'Node' in globals():
+        if not _ROS2_AVAILABLE:
             self.logger.warning("ROS2 not available, simulating waypoint following")
             return self._simulate_waypoints(waypoints)
             
@@ -352,88 +435,92 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
                 
             # Create waypoints goal
             goal_msg = FollowWaypoints.Goal()
-            goal_msg.poses = []
-            
-            for x, y, yaw in waypoints:
-                pose = PoseStamped()
-                pose.header.frame_id = "map"
-                pose.header.stamp = self.get_clock().now().to_msg()
-                pose.pose.position.x = x
-                pose.pose.position.y = y
-                pose.pose.orientation.z = math.sin(yaw / 2.0)
-                pose.pose.orientation.w = math.cos(yaw / 2.0)
-                goal_msg.poses.append(pose)
+            
+            # Convert all yaws to quaternions in one batched call
+            arr = np.asarray(waypoints, dtype=np.float64).reshape(-1, 3)
+            half_yaw = arr[:, 2] * 0.5
+            qz = np.sin(half_yaw)
+            qw = np.cos(half_yaw)
+            
+            # All waypoints of one plan share a single stamp
+            stamp = self.get_clock().now().to_msg()
+            
+            # Assign the whole sequence at once so the field is validated once
+            goal_msg.poses = [
+                self._make_pose_stamped(x, y, z, w, stamp)
+                for x, y, z, w in zip(arr[:, 0].tolist(), arr[:, 1].tolist(), qz.tolist(), qw.tolist())
+            ]
                 
             # Send goal
             self.is_navigating = True
             send_goal_future = self.waypoints_client.send_goal_async(goal_msg)
-            send_goal_future.add_done_callback(self._follow_waypoints_response)
+            goal_handle = self._await_goal_handle(send_goal_future, "Waypoints")
+            if goal_handle is None:
+                self.is_navigating = False
+                return False
+                
+            get_result_future = goal_handle.get_result_async()
+            get_result_future.add_done_callback(self._follow_waypoints_result)
             
-            self.logger.info(f"Following {len(waypoints)} waypoints")
+            self.logger.info("Following %s waypoints", len(waypoints))
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to follow waypoints: {e}")
+            self.logger.error("Failed to follow waypoints: %s", e)
             self.is_navigating = False
             return False
             
+    @staticmethod
+    def _make_pose_stamped(x: float, y: float, qz: float, qw: float, stamp) -> PoseStamped:
+        """Build a map-frame PoseStamped from position, yaw quaternion and stamp"""
+        pose = PoseStamped()
+        pose.header.frame_id = "map"
+        pose.header.stamp = stamp
+        pose.pose.position.x = x
+        pose.pose.position.y = y
+        pose.pose.orientation.z = qz
+        pose.pose.orientation.w = qw
+        return pose
+            
     def _simulate_waypoints(self, waypoints: List[Tuple[float, float, float]]) -> bool:
         """Simulate waypoint following"""
-        self.logger.info(f"Simulating {len(waypoints)} waypoints")
+        self.logger.info("Simulating %s waypoints", len(waypoints))
         
         self.is_navigating = True
         for i, (x, y, yaw) in enumerate(waypoints):
-            self.logger.info(f"Simulating waypoint {i+1}/{len(waypoints)}: ({x}, {y}, {yaw})")
-            time.sleep(2.0)  # Simulate travel time
+            self.logger.info("Simulating waypoint %s/%s: (%s, %s, %s)", i+1, len(waypoints), x, y, yaw)
+            if self._stop_event.wait(2.0):  # Simulate travel time
+                self.logger.info("Simulated waypoint following cancelled")
+                self.is_navigating = False
+                return False
             
         self.is_navigating = False
         self.logger.info("Simulated waypoint following completed")
         return True
         
-    def _follow_waypoints_response(self, future) -> None:
-        """Handle waypoints response"""
-        try:
-            goal_handle = future.result()
-            if not goal_handle.accepted:
-                self.logger.error("Waypoints goal rejected")
-                self.is_navigating = False
-                return
-                
-            self.logger.info("Waypoints goal accepted")
-            
-            get_result_future = goal_handle.get_result_async()
-            get_result_future.add_done_callback(self._follow_waypoints_result)
-            
-        except Exception as e:
-            self.logger.error(f"Error in waypoints response: {e}")
-            self.is_navigating = False
-            
     def _follow_waypoints_result(self, future) -> None:
         """Handle waypoints result"""
         try:
             result = future.result().result
             if result:
-                self.logger.info(f"Waypoints completed: {result}")
+                self.logger.info("Waypoints completed: %s", result)
             else:
                 self.logger.warning("Waypoints completed with no result")
         except Exception as e:
-            self.logger.error(f"Error in waypoints result: {e}")
+            self.logger.error("Error in waypoints result: %s", e)
         finally:
             self.is_navigating = False
             
     def stop_robot(self) -> None:
         """Stop robot movement"""
-        if 'Node' in globals() and self.cmd_vel_pub:
-            twist = Twist()
-            twist.linear.x = 0.0
-            twist.angular.z = 0.0
-            self.cmd_vel_pub.publish(twist)
+        if _ROS2_AVAILABLE and self.cmd_vel_pub:
+            self.cmd_vel_pub.publish(self._zero_twist)
             
         self.logger.info("Robot stopped")
         
     def set_initial_pose(self, x: float, y: float, yaw: float) -> None:
         """Set initial robot pose for localization"""
-        if not 'Node' in globals() or not self.initial_pose_pub:
+        if not _ROS2_AVAILABLE or not self.initial_pose_pub:
             self.logger.warning("Cannot set initial pose - ROS2 not available")
             return
             
@@ -444,22 +531,25 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
             
             pose_msg.pose.pose.position.x = x
             pose_msg.pose.pose.position.y = y
-            pose_msg.pose.pose.orientation.z = math.sin(yaw / 2.0)
-            pose_msg.pose.pose.orientation.w = math.cos(yaw / 2.0)
+            qz, qw = _yaw_to_quat(yaw)
+            pose_msg.pose.pose.orientation.z = qz
+            pose_msg.pose.pose.orientation.w = qw
             
             self.initial_pose_pub.publish(pose_msg)
-            self.logger.info(f"Initial pose set: ({x}, {y}, {yaw})")
+            self.logger.info("Initial pose set: (%s, %s, %s)", x, y, yaw)
             
         except Exception as e:
-            self.logger.error(f"Failed to set initial pose: {e}")
+            self.logger.error("Failed to set initial pose: %s", e)
             
-    def _pose_callback(self, msg: PoseWithCovarianceStamped) -> None:
-        """Handle pose updates"""
-        self.current_pose = msg
-        
     def _map_callback(self, msg: OccupancyGrid) -> None:
         """Handle map updates"""
-        self.current_map = msg
+        height, width = msg.info.height, msg.info.width
+        if len(msg.data) != height * width:
+            self.logger.warning("Ignoring map update: %d cells for a %dx%d grid",
+                                len(msg.data), width, height)
+            return
+        # Zero-copy int8 view over the message buffer, shaped (height, width)
+        self._map = (msg, np.frombuffer(msg.data, dtype=np.int8).reshape((height, width)))
         
     def get_current_pose(self) -> Optional[PoseWithCovarianceStamped]:
         """Get current robot pose"""
@@ -467,7 +557,11 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
         
     def get_current_map(self) -> Optional[OccupancyGrid]:
         """Get current occupancy grid map"""
-        return self.current_map
+        return self._map[0]
+
+    def get_current_map_array(self) -> Optional[np.ndarray]:
+        """Get current occupancy grid as an int8 (height, width) array view"""
+        return self._map[1]
         
     def is_navigation_active(self) -> bool:
         """Check if navigation is currently active"""
@@ -477,9 +571,17 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
         """Run navigation system (blocking)"""
         self.start_navigation()
         try:
-            while rclpy.ok():
-                rclpy.spin_once(self, timeout_sec=1.0)
-        except KeyboardInterrupt:
+            # Block until stop_navigation(); the executor only wakes for
+            # callbacks and for the stop future completing
+            if _ROS2_AVAILABLE:
+                if self._executor is None:
+                    self._executor = SingleThreadedExecutor()
+                    self._executor.add_node(self)
+                self._spin_done = Future()
+                self._executor.spin_until_future_complete(self._spin_done)
+            else:
+                self._stop_event.wait()
+        except (KeyboardInterrupt, ExternalShutdownException):
             self.logger.info("Received keyboard interrupt")
         finally:
             self.stop_navigation()
@@ -490,5 +592,18 @@ class NavigationAutomation(Node if 'Node' in globals() else object):
         self.stop_navigation()
         self.stop_robot()
         
-        if 'Node' in globals():
+        # stop_navigation() wakes the simulated goal; wait for it to return
+        if self._sim_future is not None:
+            try:
+                self._sim_future.result(timeout=2.0)
+            except FutureTimeoutError:
+                self.logger.warning("Simulated navigation did not stop within 2 seconds")
+            except Exception as e:
+                self.logger.error("Simulated navigation failed: %s", e)
+        self._sim_pool.shutdown(wait=False)
+        
+        if self._executor is not None:
+            self._executor.shutdown()
+            
+        if _ROS2_AVAILABLE:
             self.destroy_node()
\ No newline at end of file
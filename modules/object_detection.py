@@ -6,6 +6,14 @@ Supports both simulation and hardware deployment
 """
 
 import rclpy
+import importlib.util
+import os
+import sys
+import array
+import ast
+import hashlib
+import queue
+import shutil
 import time
 import threading
 import logging
@@ -17,43 +25,90 @@ from pathlib import Path
 # ROS2 imports
 try:
     from rclpy.node import Node
+    from rclpy.callback_groups import ReentrantCallbackGroup
+    from rclpy.executors import MultiThreadedExecutor, ExternalShutdownException
+    from rclpy.qos import QoSProfile, ReliabilityPolicy, HistoryPolicy
     from sensor_msgs.msg import Image, CameraInfo
     from vision_msgs.msg import Detection2D, Detection2DArray, ObjectHypothesisWithPose
     from std_msgs.msg import Header
-    from cv_bridge import CvBridge
 except ImportError:
     # Fallback for systems without ROS2 installed
     Node = object
+    ReentrantCallbackGroup = object
+    MultiThreadedExecutor = object
+    ExternalShutdownException = Exception
+    QoSProfile = object
+    ReliabilityPolicy = object
+    HistoryPolicy = object
     Image = object
     CameraInfo = object
     Detection2D = object
     Detection2DArray = object
     ObjectHypothesisWithPose = object
     Header = object
-    CvBridge = object
 
-# YOLOv8 imports
-try:
-    from ultralytics import YOLO
-    YOLO_AVAILABLE = True
-except ImportError:
-    YOLO_AVAILABLE = False
-    YOLO = None
 
+def _lazy_import(name: str):
+    """
+    Import a module that only executes on first attribute access
+    
+    Returns:
+        The module, or None if it is not installed
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# YOLOv8 and ONNX Runtime imports (pull in torch; deferred until used)
+ultralytics = _lazy_import('ultralytics')
+YOLO_AVAILABLE = ultralytics is not None
+
+ort = _lazy_import('onnxruntime')
+ORT_AVAILABLE = ort is not None
+
+# cv_bridge handles camera encodings the direct conversion does not
+cv_bridge = _lazy_import('cv_bridge')
+CV_BRIDGE_AVAILABLE = cv_bridge is not None
 
-class ObjectDetection(Node if 'Node' in globals() else object):
+_ROS2_AVAILABLE = Node is not object
+
+# Bytes per pixel and OpenCV conversion to BGR for directly supported encodings
+_ENCODINGS = {
+    'bgr8': (3, None),
+    'rgb8': (3, cv2.COLOR_RGB2BGR),
+    'bgra8': (4, cv2.COLOR_BGRA2BGR),
+    'rgba8': (4, cv2.COLOR_RGBA2BGR),
+    'mono8': (1, cv2.COLOR_GRAY2BGR),
+}
+
+# Classes reported by the simulation mode
+_MOCK_OBJECTS = ("person", "chair", "table", "cup", "book", "laptop", "bottle", "phone")
+
+
+class ObjectDetection(Node if _ROS2_AVAILABLE else object):
     """Handles object detection using YOLOv8 and OpenCV"""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, **node_kwargs):
         """
         Initialize object detection
         
         Args:
             config: Configuration dictionary
+            node_kwargs: Extra rclpy Node arguments (context, namespace,
+                parameter_overrides, ...) for hosting the node in a shared process
         """
         # Initialize ROS node if available
-        if 'Node' in globals():
-            super().__init__('object_detection')
+        if _ROS2_AVAILABLE:
+            super().__init__('object_detection', **node_kwargs)
             
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -62,35 +117,131 @@ class ObjectDetection(Node if 'Node' in globals() else object):
         detection_config = config.get('detection', {})
         self.model_path = detection_config.get('model_path', 'yolov8n.pt')
         self.confidence = detection_config.get('confidence', 0.5)
+        self.iou_threshold = detection_config.get('iou_threshold', 0.45)
+        
+        # Inference backend: 'ultralytics' (PyTorch or TensorRT engine),
+        # 'onnxruntime' for hosts without TensorRT, or 'auto' to pick from
+        # the installed packages and hardware at initialize()
+        self.backend = detection_config.get('backend', 'auto')
+        
+        # 'auto' lets each backend pick the fastest device; 'cpu' or a CUDA
+        # device ('cuda:0', 0) forces one
+        self.device = detection_config.get('device', 'auto')
         self.camera_topic = detection_config.get('camera_topic', '/camera/image_raw')
+        # 'sensor_data' (best effort) drops frames rather than retransmitting
+        # them; 'reliable' when every frame must arrive, e.g. replaying a bag
+        self.qos_profile = detection_config.get('qos_profile', 'sensor_data')
+        
+        # TensorRT export: precision is 'fp16' or 'int8', None keeps PyTorch
+        self.precision = detection_config.get('precision')
+        self.imgsz = detection_config.get('imgsz', 640)
+        self.export_nms = detection_config.get('export_nms', True)
+        
+        # INT8 post-training quantization: Ultralytics dataset YAML and the
+        # fraction of it used as the representative calibration set
+        calibration = detection_config.get('calibration', {})
+        self.calib_data = calibration.get('data')
+        self.calib_fraction = calibration.get('fraction', 1.0)
+        
+        # Frames per inference call; >1 needs an engine exported with dynamic batch
+        self.batch_size = max(1, int(detection_config.get('batch_size', 1)))
+        self.show_fps = detection_config.get('show_fps', True)
+        
+        # Scheduling for threads running inference: CPUs to pin to and a
+        # nice value (negative values need CAP_SYS_NICE)
+        self.cpu_affinity = detection_config.get('cpu_affinity')
+        self.thread_nice = detection_config.get('thread_nice')
+        
+        # Letterbox/normalize frames on the GPU instead of in Ultralytics' CPU path
+        self.gpu_preprocess = detection_config.get('gpu_preprocess', False)
         
         # State tracking
         self.is_detecting = False
         self.detection_active = False
         self.model = None
-        self.bridge = None
+        self._predictor = None
+        
+        # ONNX Runtime session with a preallocated input tensor and letterbox canvas
+        self._ort_session = None
+        self._ort_input_name = None
+        self._ort_input = None
+        self._ort_canvas = None
+        self._device = None
+        self._half = False
         self.class_names = []
+        self.class_names_list: List[str] = []
+        
+        # Rendered label sizes; bounded by class count x 100 confidence strings
+        self._label_size_cache: Dict[str, Tuple[int, int]] = {}
         
         # ROS2 subscribers and publishers
         self.image_sub = None
         self.detection_pub = None
         self.image_pub = None
+        self._annotated_msg = None
+        
+        # /detection_image subscriber count, refreshed once per second
+        self._annotated_subscribers = 0
+        self._subscriber_timer = None
+        
+        # Reused detection messages: one array plus a pool of Detection2D
+        # slots, each holding its single hypothesis, grown on demand
+        self._det_array = None
+        self._det_pool: List = []
+        self._hypothesis_pool: List = []
+        
+        # Latest (image, header) pairs waiting for the next batched inference
+        self._frame_queue = queue.Queue(maxsize=self.batch_size)
+        
+        # Serializes producers so a slot freed by dropping the oldest frame
+        # cannot be taken by another image callback before the put
+        self._frame_put_lock = threading.Lock()
+        
+        # Dedicated inference thread draining the frame queue, so executor
+        # threads only ever enqueue frames and stay free for other callbacks
+        self._inference_thread = None
+        self._image_cbg = None
+        
+        # Detected frames handed to the publisher thread; two slots let the
+        # next inference overlap annotation and publishing of the previous
+        # frame, and a full queue applies back-pressure
+        self._publish_queue = queue.Queue(maxsize=2)
+        self._publish_thread = None
         
-        # Detection thread
-        self.detection_thread = None
+        # Fallback converter for other encodings, and encodings already
+        # reported as unsupported
+        self._cv_bridge = None
+        self._warned_encodings = set()
         
         # Performance tracking
         self.detection_count = 0
         self.fps_counter = 0
-        self.last_fps_time = time.time()
+        self.last_fps_time = time.monotonic()
+        self._fps_display = 0.0
+        
+        # Executor that services this node's callbacks when run() owns the
+        # node; frames are processed as they arrive instead of from a polling
+        # thread. Created in run(), since the orchestrator spins its own
+        self._executor = None
         
     def initialize(self) -> bool:
         """Initialize object detection module"""
         try:
             self.logger.info("Initializing object detection module")
             
-            # Check YOLO availability
-            if not YOLO_AVAILABLE:
+            if self.backend == 'auto':
+                self.backend = self._select_backend()
+                self.logger.info(f"Selected {self.backend} detection backend")
+                
+            # Check backend availability
+            if self.backend == 'onnxruntime':
+                if not ORT_AVAILABLE:
+                    self.logger.error("ONNX Runtime not available. Install with: pip install onnxruntime-gpu")
+                    return False
+                if not YOLO_AVAILABLE and Path(self.model_path).suffix != '.onnx':
+                    self.logger.error("YOLOv8 needed to export the model to ONNX. Install with: pip install ultralytics")
+                    return False
+            elif not YOLO_AVAILABLE:
                 self.logger.error("YOLOv8 not available. Install with: pip install ultralytics")
                 return False
                 
@@ -99,9 +250,8 @@ class ObjectDetection(Node if 'Node' in globals() else object):
                 return False
                 
             # Setup ROS connections if available
-            if 'Node' in globals():
+            if _ROS2_AVAILABLE:
                 self._setup_ros_connections()
-                self.bridge = CvBridge()
                 self.logger.info("ROS2 object detection connections established")
             else:
                 self.logger.info("ROS2 not available, running object detection in simulation mode")
@@ -112,8 +262,31 @@ class ObjectDetection(Node if 'Node' in globals() else object):
             self.logger.error(f"Failed to initialize object detection: {e}")
             return False
             
+    def _select_backend(self) -> str:
+        """
+        Choose the inference backend for this host
+        
+        With CUDA available, Ultralytics runs the model on the GPU (as a
+        TensorRT engine when a precision is configured), so it is preferred.
+        On CPU-only hosts ONNX Runtime is markedly faster than PyTorch.
+        
+        Returns:
+            'ultralytics' or 'onnxruntime'
+        """
+        if YOLO_AVAILABLE and self.device != 'cpu':
+            import torch
+            if torch.cuda.is_available():
+                return 'ultralytics'
+                
+        if ORT_AVAILABLE and (YOLO_AVAILABLE or Path(self.model_path).suffix == '.onnx'):
+            return 'onnxruntime'
+        return 'ultralytics'
+        
     def _load_model(self) -> bool:
         """Load YOLOv8 model"""
+        if self.backend == 'onnxruntime':
+            return self._load_onnx_model()
+            
         try:
             self.logger.info(f"Loading YOLOv8 model: {self.model_path}")
             
@@ -121,11 +294,18 @@ class ObjectDetection(Node if 'Node' in globals() else object):
             if not Path(self.model_path).exists():
                 self.logger.warning(f"Model file {self.model_path} not found, will download")
                 
-            # Load model
-            self.model = YOLO(self.model_path)
+            # Load model, preferring a cached TensorRT engine when requested
+            engine_path = self._get_engine_path()
+            if engine_path:
+                self.model = ultralytics.YOLO(engine_path, task='detect')
+            else:
+                self.model = ultralytics.YOLO(self.model_path)
             
-            # Get class names
+            # Get class names, plus a list for direct indexing by class id
             self.class_names = self.model.names
+            self.class_names_list = [self.class_names[i] for i in sorted(self.class_names)]
+            
+            self._warm_up_model()
             
             self.logger.info(f"YOLOv8 model loaded successfully with {len(self.class_names)} classes")
             return True
@@ -134,15 +314,286 @@ class ObjectDetection(Node if 'Node' in globals() else object):
             self.logger.error(f"Failed to load YOLOv8 model: {e}")
             return False
             
+    def _load_onnx_model(self) -> bool:
+        """Load the YOLOv8 model into an ONNX Runtime session"""
+        try:
+            onnx_path = self._get_onnx_path()
+            self.logger.info(f"Loading YOLOv8 ONNX model: {onnx_path}")
+            
+            # Prefer TensorRT, then CUDA, then CPU, among what this build provides
+            available = ort.get_available_providers()
+            if self.device == 'cpu':
+                available = ['CPUExecutionProvider']
+            providers = [
+                provider for provider in (
+                    ('TensorrtExecutionProvider', {'trt_fp16_enable': True}),
+                    'CUDAExecutionProvider',
+                    'CPUExecutionProvider'
+                )
+                if (provider[0] if isinstance(provider, tuple) else provider) in available
+            ]
+            self._ort_session = ort.InferenceSession(onnx_path, providers=providers)
+            
+            model_input = self._ort_session.get_inputs()[0]
+            self._ort_input_name = model_input.name
+            input_dtype = np.float16 if model_input.type == 'tensor(float16)' else np.float32
+            self._ort_input = np.zeros((1, 3, self.imgsz, self.imgsz), dtype=input_dtype)
+            self._ort_canvas = np.full((self.imgsz, self.imgsz, 3), 114, dtype=np.uint8)
+            
+            # Ultralytics stores the class map as a dict literal in the metadata
+            metadata = self._ort_session.get_modelmeta().custom_metadata_map
+            self.class_names = ast.literal_eval(metadata['names']) if 'names' in metadata else {}
+            self.class_names_list = [self.class_names[i] for i in sorted(self.class_names)]
+            
+            self.logger.info(
+                f"YOLOv8 ONNX model loaded with {len(self.class_names)} classes "
+                f"on {self._ort_session.get_providers()[0]}"
+            )
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load YOLOv8 ONNX model: {e}")
+            return False
+            
+    def _get_onnx_path(self) -> str:
+        """Return an ONNX file for the configured model, exporting it once"""
+        model_file = Path(self.model_path)
+        if model_file.suffix == '.onnx':
+            return str(model_file)
+            
+        nms_tag = '_nms' if self.export_nms else ''
+        onnx_file = model_file.with_name(f"{model_file.stem}_{self.imgsz}{nms_tag}.onnx")
+        if not onnx_file.exists():
+            self.logger.info(f"Exporting {model_file} to ONNX, this runs once")
+            exported = Path(ultralytics.YOLO(str(model_file)).export(
+                format='onnx', imgsz=self.imgsz, nms=self.export_nms
+            ))
+            exported.replace(onnx_file)
+        return str(onnx_file)
+        
+    def _detect_onnx(self, image: np.ndarray) -> List[Dict]:
+        """
+        Perform object detection on image with the ONNX Runtime session
+        
+        Args:
+            image: OpenCV image
+            
+        Returns:
+            List of detection dictionaries
+        """
+        # Letterbox into the preallocated canvas, then BGR->RGB, HWC->CHW and
+        # scale straight into the preallocated input tensor
+        h, w = image.shape[:2]
+        gain = min(self.imgsz / h, self.imgsz / w)
+        new_h, new_w = round(h * gain), round(w * gain)
+        top = (self.imgsz - new_h) // 2
+        left = (self.imgsz - new_w) // 2
+        
+        canvas = self._ort_canvas
+        canvas.fill(114)
+        canvas[top:top + new_h, left:left + new_w] = cv2.resize(
+            image, (new_w, new_h), interpolation=cv2.INTER_LINEAR
+        )
+        np.multiply(
+            canvas[..., ::-1].transpose(2, 0, 1), 1.0 / 255.0,
+            out=self._ort_input[0], casting='unsafe'
+        )
+        
+        output = self._ort_session.run(None, {self._ort_input_name: self._ort_input})[0][0]
+        
+        if output.shape[-1] == 6:
+            # NMS fused at export: rows of (x1, y1, x2, y2, score, class)
+            output = output[output[:, 4] >= self.confidence]
+            xyxy = output[:, :4]
+            confidences = output[:, 4]
+            class_ids = output[:, 5].astype(np.int32)
+        else:
+            # Raw head: (4 + classes, anchors) with boxes as (cx, cy, w, h)
+            output = output.T
+            class_scores = output[:, 4:]
+            class_ids = class_scores.argmax(axis=1).astype(np.int32)
+            confidences = class_scores[np.arange(len(class_ids)), class_ids]
+            keep = confidences >= self.confidence
+            boxes, confidences, class_ids = output[keep, :4], confidences[keep], class_ids[keep]
+            
+            top_left = boxes[:, :2] - boxes[:, 2:] / 2
+            keep = cv2.dnn.NMSBoxes(
+                np.hstack((top_left, boxes[:, 2:])).tolist(),
+                confidences.tolist(),
+                self.confidence,
+                self.iou_threshold
+            )
+            keep = np.asarray(keep, dtype=np.int64).reshape(-1)
+            xyxy = np.hstack((top_left, top_left + boxes[:, 2:]))[keep]
+            confidences, class_ids = confidences[keep], class_ids[keep]
+            
+        xyxy = (xyxy - (left, top, left, top)) / gain
+        return self._build_detections(xyxy, confidences, class_ids)
+        
+    def _warm_up_model(self) -> None:
+        """
+        Run one dummy inference so the predictor is built up front
+        
+        The first call creates the Ultralytics predictor together with its
+        backend (for engines: the TensorRT execution context and its device
+        bindings). Keeping that predictor lets _detect_objects call it
+        directly, without the per-frame argument merging done by YOLO.__call__.
+        """
+        dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        predict_args = {'conf': self.confidence, 'imgsz': self.imgsz, 'verbose': False}
+        if self.device != 'auto':
+            predict_args['device'] = self.device
+        self.model.predict(dummy, **predict_args)
+        self._predictor = self.model.predictor
+        
+        if self.gpu_preprocess:
+            if self._predictor.device.type == 'cuda':
+                self._device = self._predictor.device
+                self._half = bool(getattr(self._predictor.model, 'fp16', False))
+            else:
+                self.logger.warning("GPU preprocessing requested but model runs on CPU, disabling")
+                self.gpu_preprocess = False
+                
+    def _preprocess_on_gpu(self, image: np.ndarray) -> Tuple[object, float, float, float]:
+        """
+        Letterbox and normalize a BGR frame on the GPU
+        
+        The raw uint8 frame is uploaded once; BGR->RGB, HWC->NCHW, resize,
+        padding and scaling to [0, 1] all run as device ops, and Ultralytics
+        skips its own preprocessing for tensor inputs.
+        
+        Args:
+            image: OpenCV BGR image
+            
+        Returns:
+            Tuple of (input tensor, gain, x padding, y padding) where the last
+            three map letterboxed box coordinates back to the original frame
+        """
+        import torch
+        import torch.nn.functional as F
+        
+        h, w = image.shape[:2]
+        gain = min(self.imgsz / h, self.imgsz / w)
+        new_h, new_w = round(h * gain), round(w * gain)
+        top = (self.imgsz - new_h) // 2
+        left = (self.imgsz - new_w) // 2
+        
+        frame = torch.from_numpy(image).to(self._device, non_blocking=True)
+        frame = frame.flip(-1).permute(2, 0, 1).unsqueeze(0).float()
+        frame = F.interpolate(frame, size=(new_h, new_w), mode='bilinear', align_corners=False)
+        frame = F.pad(
+            frame,
+            (left, self.imgsz - new_w - left, top, self.imgsz - new_h - top),
+            value=114.0
+        ).div_(255.0)
+        if self._half:
+            frame = frame.half()
+            
+        return frame, gain, float(left), float(top)
+        
+    def _get_engine_path(self) -> Optional[str]:
+        """
+        Return a TensorRT engine for the configured model, exporting it once
+        
+        Engines are cached next to the .pt file, keyed by precision and GPU
+        name since a serialized engine is only valid on the device it was
+        built for.
+        
+        Returns:
+            Engine file path, or None to fall back to the PyTorch model
+        """
+        model_file = Path(self.model_path)
+        if model_file.suffix == '.engine':
+            return str(model_file)
+        if self.precision not in ('fp16', 'int8') or model_file.suffix != '.pt':
+            return None
+            
+        try:
+            import torch
+            
+            if not torch.cuda.is_available():
+                self.logger.warning("CUDA not available, skipping TensorRT export")
+                return None
+                
+            calib_tag = ''
+            if self.precision == 'int8':
+                if not self.calib_data:
+                    self.logger.warning("INT8 export needs detection.calibration.data, using PyTorch model")
+                    return None
+                calib_tag = f"_{self._calibration_key()}"
+                
+            device_name = torch.cuda.get_device_name(0).replace(' ', '_')
+            nms_tag = '_nms' if self.export_nms else ''
+            batch_tag = f"_b{self.batch_size}" if self.batch_size > 1 else ''
+            engine_file = model_file.with_name(
+                f"{model_file.stem}_{self.precision}{calib_tag}{nms_tag}{batch_tag}_{device_name}.engine"
+            )
+            if engine_file.exists():
+                return str(engine_file)
+                
+            # Ultralytics reads/writes the calibration cache next to the model;
+            # keep our copy keyed like the engine so a rebuild skips calibration
+            # and a different dataset never reuses a stale one
+            export_cache = model_file.with_suffix('.cache')
+            keyed_cache = engine_file.with_suffix('.cache')
+            if self.precision == 'int8':
+                if keyed_cache.exists():
+                    shutil.copyfile(keyed_cache, export_cache)
+                elif export_cache.exists():
+                    export_cache.unlink()
+                
+            self.logger.info(f"Exporting {model_file} to TensorRT ({self.precision}), this runs once")
+            export_args = {'format': 'engine', 'imgsz': self.imgsz, 'device': 0}
+            if self.export_nms:
+                # Bake NMS into the engine so it returns final detections
+                export_args['nms'] = True
+            if self.batch_size > 1:
+                # Dynamic batch dimension optimized for the configured batch size
+                export_args.update(dynamic=True, batch=self.batch_size)
+            if self.precision == 'int8':
+                # Ultralytics calibrates with TensorRT's entropy calibrator
+                # (per-channel weight scales) over this dataset
+                export_args.update(int8=True, data=self.calib_data, fraction=self.calib_fraction)
+            else:
+                export_args['half'] = True
+                
+            exported = Path(ultralytics.YOLO(str(model_file)).export(**export_args))
+            exported.replace(engine_file)
+            if self.precision == 'int8' and export_cache.exists():
+                export_cache.replace(keyed_cache)
+            return str(engine_file)
+            
+        except Exception as e:
+            self.logger.warning(f"TensorRT export failed, using PyTorch model: {e}")
+            return None
+            
+    def _calibration_key(self) -> str:
+        """Short hash identifying the INT8 calibration dataset and fraction"""
+        data_file = Path(self.calib_data)
+        mtime = data_file.stat().st_mtime if data_file.exists() else 0.0
+        key = f"{data_file.resolve()}:{mtime}:{self.calib_fraction}"
+        return hashlib.sha1(key.encode()).hexdigest()[:8]
+        
     def _setup_ros_connections(self) -> None:
         """Setup ROS2 subscribers and publishers"""
         try:
-            # Image subscriber
+            # Image subscriber; only the latest frame matters, and KEEP_LAST
+            # depth 1 is what shared-memory transports need to loan buffers
+            # (see config/fastdds_shm_profile.xml)
+            image_qos = QoSProfile(
+                reliability=(ReliabilityPolicy.RELIABLE if self.qos_profile == 'reliable'
+                             else ReliabilityPolicy.BEST_EFFORT),
+                history=HistoryPolicy.KEEP_LAST,
+                depth=1
+            )
+            # Reentrant: the callback only enqueues, so overlapping calls are safe
+            self._image_cbg = ReentrantCallbackGroup()
             self.image_sub = self.create_subscription(
                 Image,
                 self.camera_topic,
                 self._image_callback,
-                10
+                image_qos,
+                callback_group=self._image_cbg
             )
             
             # Detection publisher
@@ -152,18 +603,30 @@ class ObjectDetection(Node if 'Node' in globals() else object):
                 10
             )
             
-            # Annotated image publisher
+            # Annotated image publisher; the message is reused for every
+            # frame since publish() serializes it before returning
             self.image_pub = self.create_publisher(
                 Image,
                 '/detection_image',
                 10
             )
+            self._annotated_msg = Image()
+            self._annotated_msg.encoding = 'bgr8'
+            self._det_array = Detection2DArray()
+            
+            # Annotation is skipped entirely while nobody watches the image
+            self._refresh_subscriber_counts()
+            self._subscriber_timer = self.create_timer(1.0, self._refresh_subscriber_counts)
             
             self.logger.info("ROS2 detection connections established")
 
         except Exception as e:
             self.logger.error(f"Failed to setup ROS detection connections: {e}")
 
+    def _refresh_subscriber_counts(self) -> None:
+        """Cache the annotated image subscriber count"""
+        self._annotated_subscribers = self.image_pub.get_subscription_count()
+        
     def _start_simulation_mode(self) -> None:
         """Start object detection simulation mode"""
         self.logger.info("Object detection simulation mode initialized")
@@ -178,10 +641,6 @@ class ObjectDetection(Node if 'Node' in globals() else object):
         """Run mock object detection simulation"""
         import random
 
-        mock_objects = [
-            "person", "chair", "table", "cup", "book", "laptop", "bottle", "phone"
-        ]
-
         while self.detection_active:
             if random.random() < 0.3:  # 30% chance every few seconds
                 # Generate random detection
@@ -189,7 +648,7 @@ class ObjectDetection(Node if 'Node' in globals() else object):
                 detections = []
 
                 for _ in range(num_objects):
-                    obj_class = random.choice(mock_objects)
+                    obj_class = random.choice(_MOCK_OBJECTS)
                     confidence = random.uniform(0.6, 0.95)
                     bbox = [
                         random.uniform(50, 400),   # x1
@@ -205,15 +664,20 @@ class ObjectDetection(Node if 'Node' in globals() else object):
                     }
                     detections.append(detection)
 
-                # Log detections
-                self.logger.info(f"🔍 Detected {len(detections)} object(s):")
-                for i, det in enumerate(detections, 1):
-                    self.logger.info(f"  {i}. {det['class']} ({det['confidence']:.2f} confidence)")
+                # Log all detections as a single record
+                self.logger.info(
+                    "🔍 Detected %d object(s): %s", len(detections),
+                    "; ".join(f"{det['class']} ({det['confidence']:.2f})" for det in detections)
+                )
 
                 self.detection_count += len(detections)
 
             time.sleep(random.uniform(3, 8))  # Random interval between detections
             
+    def start(self) -> None:
+        """Start object detection (AutomationModule interface)"""
+        self.start_detection()
+        
     def start_detection(self) -> None:
         """Start object detection"""
         if self.detection_active:
@@ -221,64 +685,185 @@ class ObjectDetection(Node if 'Node' in globals() else object):
             return
             
         self.detection_active = True
-        self.logger.info("Object detection started")
         
-        # Start detection thread
-        self.detection_thread = threading.Thread(target=self._detection_loop, daemon=True)
-        self.detection_thread.start()
+        if _ROS2_AVAILABLE:
+            # Discard frames, and any stop sentinel, left from a previous run
+            try:
+                while True:
+                    self._frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._inference_thread = threading.Thread(target=self._inference_loop, daemon=True)
+            self._inference_thread.start()
+            self._publish_thread = threading.Thread(target=self._publish_loop, daemon=True)
+            self._publish_thread.start()
+            
+        self.logger.info("Object detection started")
         
     def stop_detection(self) -> None:
         """Stop object detection"""
         self.detection_active = False
         self.is_detecting = False
         
-        if self.detection_thread:
-            self.detection_thread.join(timeout=5.0)
+        # Wake the inference thread with a sentinel, and join it first so
+        # nothing is queued for publishing after the publish sentinel
+        if self._inference_thread:
+            self._put_latest_frame(None)
+            self._inference_thread.join(timeout=5.0)
+            self._inference_thread = None
+            
+        if self._publish_thread:
+            self._publish_queue.put(None)
+            self._publish_thread.join(timeout=5.0)
+            self._publish_thread = None
             
         self.logger.info("Object detection stopped")
         
-    def _detection_loop(self) -> None:
-        """Main detection loop"""
-        while self.detection_active:
-            try:
-                if 'Node' in globals():
-                    rclpy.spin_once(self, timeout_sec=0.1)
-                time.sleep(0.01)  # 100 FPS max
-            except Exception as e:
-                self.logger.error(f"Error in detection loop: {e}")
-                time.sleep(0.1)
-                
     def _image_callback(self, msg: Image) -> None:
-        """Handle incoming camera images"""
-        if not self.detection_active or self.is_detecting:
+        """Queue an incoming camera image for the inference thread"""
+        if not self.detection_active:
             return
             
-        self.is_detecting = True
-        
         try:
-            # Convert ROS image to OpenCV format
-            cv_image = self.bridge.imgmsg_to_cv2(msg, desired_encoding='bgr8')
+            # View the ROS image buffer as an OpenCV array without copying
+            image = self._image_to_array(msg)
+            if image is not None:
+                self._put_latest_frame((image, msg.header))
+        except Exception as e:
+            self.logger.error(f"Error queueing image: {e}")
             
-            # Perform object detection
-            detections = self._detect_objects(cv_image)
+    def _put_latest_frame(self, frame) -> None:
+        """Queue a frame (or the None stop sentinel), dropping the oldest if full"""
+        with self._frame_put_lock:
+            try:
+                self._frame_queue.put_nowait(frame)
+            except queue.Full:
+                # Keep the newest frames: drop the oldest queued one. Only the
+                # inference thread consumes, so the freed slot stays free
+                try:
+                    self._frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self._frame_queue.put_nowait(frame)
             
-            # Publish results
-            if self.detection_pub:
-                self._publish_detections(detections, msg.header)
+    def _inference_loop(self) -> None:
+        """Run batched inference on queued frames until detection stops"""
+        self._tune_inference_thread()
+        stopping = False
+        while not stopping:
+            # Blocks until a frame arrives; stop_detection() queues None.
+            # A frame that displaced the sentinel still ends the loop via
+            # detection_active
+            frame = self._frame_queue.get()
+            if frame is None or not self.detection_active:
+                break
+            batch = [frame]
                 
-            # Publish annotated image
-            if self.image_pub:
-                annotated_image = self._draw_detections(cv_image, detections)
-                self._publish_annotated_image(annotated_image, msg.header)
+            # Frames that arrived during the previous inference join this batch
+            try:
+                while len(batch) < self.batch_size:
+                    frame = self._frame_queue.get_nowait()
+                    if frame is None:
+                        stopping = True
+                        break
+                    batch.append(frame)
+            except queue.Empty:
+                pass
                 
-            # Update performance metrics
-            self._update_performance_metrics()
+            self._process_batch(batch)
+            
+    def _tune_inference_thread(self) -> None:
+        """Apply configured CPU affinity and priority to the calling thread"""
+        try:
+            # On Linux both calls act on the calling thread only
+            if self.cpu_affinity:
+                os.sched_setaffinity(0, set(self.cpu_affinity))
+            if self.thread_nice:
+                os.nice(self.thread_nice)
+        except (AttributeError, OSError) as e:
+            self.logger.warning(f"Could not tune detection thread scheduling: {e}")
             
+    def _process_batch(self, batch: List[Tuple[np.ndarray, Header]]) -> None:
+        """Run one batched inference and hand each frame to the publisher thread"""
+        self.is_detecting = True
+        
+        try:
+            # Perform object detection
+            batch_detections = self._detect_batch([image for image, _ in batch])
+            
+            for (cv_image, header), detections in zip(batch, batch_detections):
+                self._publish_queue.put((cv_image, header, detections))
+                
         except Exception as e:
             self.logger.error(f"Error processing image: {e}")
         finally:
             self.is_detecting = False
             
+    def _publish_loop(self) -> None:
+        """Annotate and publish detected frames off the inference path"""
+        while True:
+            item = self._publish_queue.get()
+            if item is None:
+                break
+                
+            cv_image, header, detections = item
+            try:
+                # Publish results
+                if self.detection_pub:
+                    self._publish_detections(detections, header)
+                    
+                # Publish annotated image
+                if self.image_pub and self._annotated_subscribers:
+                    annotated_image = self._draw_detections(cv_image, detections)
+                    self._publish_annotated_image(annotated_image, header)
+                    
+                # Update performance metrics
+                self._update_performance_metrics()
+                
+            except Exception as e:
+                self.logger.error(f"Error publishing frame: {e}")
+            
+    def _image_to_array(self, msg: Image) -> Optional[np.ndarray]:
+        """
+        Wrap a sensor_msgs/Image buffer as a BGR NumPy array
+        
+        Args:
+            msg: ROS image message
+            
+        Returns:
+            (height, width, 3) uint8 array sharing memory with msg.data for
+            unpadded bgr8 input, or None for an unsupported encoding
+        """
+        if msg.encoding not in _ENCODINGS:
+            return self._convert_with_bridge(msg)
+            
+        channels, conversion = _ENCODINGS[msg.encoding]
+        row_bytes = msg.width * channels
+        rows = np.frombuffer(msg.data, dtype=np.uint8).reshape(msg.height, msg.step)
+        image = rows[:, :row_bytes].reshape(msg.height, msg.width, channels)
+        if conversion is not None:
+            # Converted into a new contiguous frame: msg.data may be read-only,
+            # and the caller's message must not change under it
+            return cv2.cvtColor(image, conversion)
+            
+        if msg.step != row_bytes:
+            # Padded rows: drop the padding so OpenCV gets a contiguous frame
+            image = np.ascontiguousarray(image)
+        return image
+        
+    def _convert_with_bridge(self, msg: Image) -> Optional[np.ndarray]:
+        """Convert an image encoding _image_to_array does not handle directly"""
+        if CV_BRIDGE_AVAILABLE:
+            if self._cv_bridge is None:
+                self._cv_bridge = cv_bridge.CvBridge()
+            return self._cv_bridge.imgmsg_to_cv2(msg, desired_encoding='bgr8')
+            
+        if msg.encoding not in self._warned_encodings:
+            self._warned_encodings.add(msg.encoding)
+            self.logger.warning(f"Unsupported image encoding '{msg.encoding}'; "
+                                f"install cv_bridge to convert it. Frames are skipped")
+        return None
+        
     def _detect_objects(self, image: np.ndarray) -> List[Dict]:
         """
         Perform object detection on image
@@ -289,40 +874,92 @@ class ObjectDetection(Node if 'Node' in globals() else object):
         Returns:
             List of detection dictionaries
         """
+        return self._detect_batch([image])[0]
+        
+    def _detect_batch(self, images: List[np.ndarray]) -> List[List[Dict]]:
+        """
+        Perform object detection on several images in one inference call
+        
+        Args:
+            images: OpenCV images
+            
+        Returns:
+            One list of detection dictionaries per input image
+        """
         try:
+            if self._ort_session is not None:
+                return [self._detect_onnx(image) for image in images]
+                
             # Run YOLOv8 inference
-            results = self.model(image, conf=self.confidence, verbose=False)
+            if self.gpu_preprocess:
+                import torch
+                
+                prepared = [self._preprocess_on_gpu(image) for image in images]
+                source = torch.cat([tensor for tensor, _, _, _ in prepared])
+                letterbox = [(gain, pad_x, pad_y) for _, gain, pad_x, pad_y in prepared]
+            else:
+                source = images
+                letterbox = [(1.0, 0.0, 0.0)] * len(images)
+            results = self._predictor(source)
             
-            detections = []
+            batch_detections = []
             
-            for result in results:
+            for result, (gain, pad_x, pad_y) in zip(results, letterbox):
                 boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        # Extract bounding box coordinates
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        confidence = box.conf[0].cpu().numpy()
-                        class_id = int(box.cls[0].cpu().numpy())
-                        
-                        # Create detection dictionary
-                        detection = {
-                            'bbox': [float(x1), float(y1), float(x2), float(y2)],
-                            'confidence': float(confidence),
-                            'class_id': class_id,
-                            'class_name': self.class_names[class_id] if class_id < len(self.class_names) else 'unknown'
-                        }
-                        detections.append(detection)
-                        
-            return detections
+                if boxes is None or len(boxes) == 0:
+                    batch_detections.append([])
+                    continue
+                    
+                # One device-to-host copy per field for all boxes
+                xyxy = boxes.xyxy.cpu().numpy()
+                confidences = boxes.conf.cpu().numpy()
+                class_ids = boxes.cls.cpu().numpy().astype(np.int32)
+                
+                # Undo the letterbox for every box at once
+                xyxy = (xyxy - (pad_x, pad_y, pad_x, pad_y)) / gain
+                
+                batch_detections.append(self._build_detections(xyxy, confidences, class_ids))
+                
+            return batch_detections
             
         except Exception as e:
             self.logger.error(f"Error in object detection: {e}")
-            return []
+            return [[] for _ in images]
+            
+    def _build_detections(self, xyxy: np.ndarray, confidences: np.ndarray,
+                          class_ids: np.ndarray) -> List[Dict]:
+        """
+        Build detection dictionaries from per-frame box arrays
+        
+        Args:
+            xyxy: (N, 4) boxes in original image coordinates
+            confidences: (N,) scores
+            class_ids: (N,) integer class ids
+            
+        Returns:
+            List of detection dictionaries
+        """
+        names = self.class_names_list
+        num_names = len(names)
+        return [
+            {
+                'bbox': bbox,
+                'confidence': confidence,
+                'class_id': class_id,
+                'class_name': names[class_id] if class_id < num_names else 'unknown'
+            }
+            for bbox, confidence, class_id in zip(
+                xyxy.tolist(), confidences.tolist(), class_ids.tolist()
+            )
+        ]
             
     def _draw_detections(self, image: np.ndarray, detections: List[Dict]) -> np.ndarray:
         """
         Draw detection bounding boxes on image
         
+        Draws in place: the camera frame has no other consumer once its
+        detections are computed, so no full-frame copy is made.
+        
         Args:
             image: OpenCV image
             detections: List of detection dictionaries
@@ -330,7 +967,8 @@ class ObjectDetection(Node if 'Node' in globals() else object):
         Returns:
             Annotated image
         """
-        annotated_image = image.copy()
+        # Read-only buffers (e.g. views over immutable bytes) still need a copy
+        annotated_image = image if image.flags.writeable else image.copy()
         
         for detection in detections:
             bbox = detection['bbox']
@@ -344,7 +982,10 @@ class ObjectDetection(Node if 'Node' in globals() else object):
             
             # Draw label
             label = f"{class_name}: {confidence:.2f}"
-            label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)[0]
+            label_size = self._label_size_cache.get(label)
+            if label_size is None:
+                label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)[0]
+                self._label_size_cache[label] = label_size
             
             # Draw label background
             cv2.rectangle(
@@ -367,27 +1008,36 @@ class ObjectDetection(Node if 'Node' in globals() else object):
             )
             
         # Draw FPS counter
-        fps = self._calculate_fps()
-        cv2.putText(
-            annotated_image,
-            f"FPS: {fps:.1f}",
-            (10, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1,
-            (0, 255, 0),
-            2
-        )
+        if self.show_fps:
+            cv2.putText(
+                annotated_image,
+                f"FPS: {self._fps_display:.1f}",
+                (10, 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                1,
+                (0, 255, 0),
+                2
+            )
         
         return annotated_image
         
     def _publish_detections(self, detections: List[Dict], header: Header) -> None:
         """Publish detection results to ROS2 topic"""
         try:
-            detection_array = Detection2DArray()
+            detection_array = self._det_array
             detection_array.header = header
             
-            for detection in detections:
+            # Grow the slot pool once to the largest frame seen so far
+            while len(self._det_pool) < len(detections):
                 detection_msg = Detection2D()
+                hypothesis = ObjectHypothesisWithPose()
+                detection_msg.results = [hypothesis]
+                self._det_pool.append(detection_msg)
+                self._hypothesis_pool.append(hypothesis)
+                
+            for detection, detection_msg, hypothesis in zip(
+                detections, self._det_pool, self._hypothesis_pool
+            ):
                 detection_msg.header = header
                 
                 # Set bounding box (center and size)
@@ -398,21 +1048,18 @@ class ObjectDetection(Node if 'Node' in globals() else object):
                 size_x = x2 - x1
                 size_y = y2 - y1
                 
-                # Create detection hypothesis
-                hypothesis = ObjectHypothesisWithPose()
+                # Fill detection hypothesis
                 hypothesis.id = detection['class_id']
                 hypothesis.score = detection['confidence']
                 
-                detection_msg.results.append(hypothesis)
-                
                 # Set bounding box (simplified - in real implementation would use proper ROI)
                 detection_msg.bbox.center.x = center_x
                 detection_msg.bbox.center.y = center_y
                 detection_msg.bbox.size_x = size_x
                 detection_msg.bbox.size_y = size_y
                 
-                detection_array.detections.append(detection_msg)
-                
+            # publish() serializes synchronously, so the slots can be refilled next frame
+            detection_array.detections = self._det_pool[:len(detections)]
             self.detection_pub.publish(detection_array)
             
         except Exception as e:
@@ -421,8 +1068,16 @@ class ObjectDetection(Node if 'Node' in globals() else object):
     def _publish_annotated_image(self, image: np.ndarray, header: Header) -> None:
         """Publish annotated image to ROS2 topic"""
         try:
-            ros_image = self.bridge.cv2_to_imgmsg(image, encoding='bgr8')
+            ros_image = self._annotated_msg
             ros_image.header = header
+            ros_image.height, ros_image.width = image.shape[:2]
+            ros_image.step = image.strides[0]
+            
+            # Single memcpy from the contiguous frame into the message field
+            data = array.array('B')
+            data.frombytes(image)
+            ros_image.data = data
+            
             self.image_pub.publish(ros_image)
         except Exception as e:
             self.logger.error(f"Error publishing annotated image: {e}")
@@ -432,18 +1087,17 @@ class ObjectDetection(Node if 'Node' in globals() else object):
         self.detection_count += 1
         self.fps_counter += 1
         
-    def _calculate_fps(self) -> float:
-        """Calculate current FPS"""
-        current_time = time.time()
+        # Refresh the displayed FPS once per second
+        current_time = time.monotonic()
         time_diff = current_time - self.last_fps_time
-        
         if time_diff >= 1.0:
-            fps = self.fps_counter / time_diff
+            self._fps_display = self.fps_counter / time_diff
             self.fps_counter = 0
             self.last_fps_time = current_time
-            return fps
-        else:
-            return self.fps_counter / max(time_diff, 0.001)
+            
+    def _calculate_fps(self) -> float:
+        """Get FPS over the last completed one-second window"""
+        return self._fps_display
             
     def detect_objects_sync(self, image_path: str) -> List[Dict]:
         """
@@ -480,11 +1134,14 @@ class ObjectDetection(Node if 'Node' in globals() else object):
         
     def run(self) -> None:
         """Run object detection (blocking)"""
+        if self._executor is None:
+            self._executor = MultiThreadedExecutor()
+            self._executor.add_node(self)
+            
         self.start_detection()
         try:
-            while rclpy.ok():
-                rclpy.spin_once(self, timeout_sec=1.0)
-        except KeyboardInterrupt:
+            self._executor.spin()
+        except (KeyboardInterrupt, ExternalShutdownException):
             self.logger.info("Received keyboard interrupt")
         finally:
             self.stop_detection()
@@ -494,5 +1151,24 @@ class ObjectDetection(Node if 'Node' in globals() else object):
         self.logger.info("Shutting down object detection")
         self.stop_detection()
         
-        if 'Node' in globals():
-            self.destroy_node()
\ No newline at end of file
+        if self._executor is not None:
+            self._executor.shutdown()
+            
+        if _ROS2_AVAILABLE:
+            self.destroy_node()
+
+
+def main(args=None) -> None:
+    """Run object detection as a standalone node"""
+    rclpy.init(args=args)
+    detection = ObjectDetection({})
+    try:
+        if detection.initialize():
+            detection.run()
+    finally:
+        detection.shutdown()
+        rclpy.try_shutdown()
+
+
+if __name__ == '__main__':
+    main()
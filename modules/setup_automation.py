@@ -7,6 +7,7 @@ Supports both simulation and hardware deployment
 
 import os
 import sys
+import shutil
 import subprocess
 import logging
 from pathlib import Path
@@ -16,6 +17,9 @@ from typing import Dict, List, Optional
 class SetupAutomation:
     """Automates ROS2 and TurtleBot3 setup and configuration"""
     
+    # ROS2 distro detected by the first instance, shared by later ones
+    _cached_distro: Optional[str] = None
+    
     def __init__(self, config: Dict, simulation_mode: bool = True):
         """
         Initialize setup automation
@@ -32,8 +36,22 @@ class SetupAutomation:
         self.workspace_path = Path.home() / "turtlebot3_ws"
         self.ros_distro = self._detect_ros_distro()
         
+        # dpkg install state per package, filled by one dpkg-query and
+        # dropped whenever apt changes the system
+        self._installed_pkgs: Optional[Dict[str, bool]] = None
+        
     def _detect_ros_distro(self) -> str:
         """Detect installed ROS2 distribution"""
+        if SetupAutomation._cached_distro:
+            return SetupAutomation._cached_distro
+            
+        # Sourcing any ROS2 setup.bash exports ROS_DISTRO; no subprocess needed
+        distro = os.environ.get('ROS_DISTRO')
+        if distro:
+            self.logger.info(f"Detected ROS2 distribution: {distro}")
+            SetupAutomation._cached_distro = distro
+            return distro
+            
         try:
             result = subprocess.run(
                 ["rosversion", "-d"],
@@ -44,6 +62,7 @@ class SetupAutomation:
             if result.returncode == 0:
                 distro = result.stdout.strip()
                 self.logger.info(f"Detected ROS2 distribution: {distro}")
+                SetupAutomation._cached_distro = distro
                 return distro
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
@@ -101,6 +120,16 @@ class SetupAutomation:
                 
         return False
         
+    def start(self) -> None:
+        """Run setup only if something is missing (AutomationModule interface)"""
+        if self.needs_setup():
+            self.logger.info("Running setup automation...")
+            self.run_setup()
+            
+    def run(self) -> None:
+        """Run the complete setup unconditionally (AutomationModule interface)"""
+        self.run_setup()
+        
     def run_setup(self) -> bool:
         """Run complete setup process"""
         try:
@@ -120,23 +149,19 @@ class SetupAutomation:
             if not self._update_system():
                 return False
 
-            # Step 2: Install ROS2 packages
-            if not self._install_ros2_packages():
-                return False
-
-            # Step 3: Install TurtleBot3 packages
-            if not self._install_turtlebot3_packages():
+            # Step 2: Install ROS2 and TurtleBot3 packages
+            if not self._install_all_packages():
                 return False
 
-            # Step 4: Create ROS workspace
+            # Step 3: Create ROS workspace
             if not self._create_workspace():
                 return False
 
-            # Step 5: Setup environment
+            # Step 4: Setup environment
             if not self._setup_environment():
                 return False
 
-            # Step 6: Verify setup
+            # Step 5: Verify setup
             if not self._verify_setup():
                 return False
 
@@ -161,6 +186,7 @@ class SetupAutomation:
             f"ros-{self.ros_distro}-nav2-lifecycle-manager",
             f"ros-{self.ros_distro}-robot-localization",
             f"ros-{self.ros_distro}-slam-toolbox",
+            "ccache",  # compiler cache used by the workspace build
         ]
         
         turtlebot3_packages = [
@@ -205,49 +231,25 @@ class SetupAutomation:
             self.logger.error(f"Failed to update system: {e}")
             return False
             
-    def _install_ros2_packages(self) -> bool:
-        """Install ROS2 packages"""
+    def _install_all_packages(self) -> bool:
+        """Install ROS2 and TurtleBot3 packages in a single apt transaction"""
         try:
-            self.logger.info("Installing ROS2 packages...")
-            packages = [
-                f"ros-{self.ros_distro}-desktop",
-                f"ros-{self.ros_distro}-navigation2",
-                f"ros-{self.ros_distro}-nav2-bringup",
-            ]
+            self.logger.info("Installing ROS2 and TurtleBot3 packages...")
             
-            cmd = ["sudo", "apt", "install", "-y"] + packages
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            
-            self.logger.info("ROS2 packages installed successfully")
-            return True
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to install ROS2 packages: {e}")
-            return False
+            # One explicit, de-duplicated list so apt locks dpkg and resolves once
+            packages = list(dict.fromkeys(self._get_required_packages()))
             
-    def _install_turtlebot3_packages(self) -> bool:
-        """Install TurtleBot3 packages"""
-        try:
-            self.logger.info("Installing TurtleBot3 packages...")
-            
-            if self.simulation_mode:
-                packages = [
-                    f"ros-{self.ros_distro}-turtlebot3*",
-                    f"ros-{self.ros_distro}-gazebo-ros-pkgs",
-                    f"ros-{self.ros_distro}-ros-gz*",
-                ]
-            else:
-                packages = [
-                    f"ros-{self.ros_distro}-turtlebot3*",
-                    f"ros-{self.ros_distro}-hls-lfcd-lds-driver",
-                ]
-                
-            cmd = ["sudo", "apt", "install", "-y"] + packages
+            cmd = [
+                "sudo", "DEBIAN_FRONTEND=noninteractive",
+                "apt", "install", "-y", "--no-install-recommends"
+            ] + packages
+            self._installed_pkgs = None
             result = subprocess.run(cmd, check=True, capture_output=True, text=True)
             
-            self.logger.info("TurtleBot3 packages installed successfully")
+            self.logger.info(f"Installed {len(packages)} ROS2 and TurtleBot3 packages successfully")
             return True
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to install TurtleBot3 packages: {e}")
+            self.logger.error(f"Failed to install ROS2 and TurtleBot3 packages: {e}")
             return False
             
     def _create_workspace(self) -> bool:
@@ -268,11 +270,24 @@ class SetupAutomation:
             self.logger.info("Building workspace...")
             os.chdir(self.workspace_path)
             
+            # Build packages in parallel, optimized, and through ccache when present
+            jobs = str(os.cpu_count() or 1)
+            cmake_args = ["-DCMAKE_BUILD_TYPE=Release"]
+            if shutil.which("ccache"):
+                cmake_args += [
+                    "-DCMAKE_C_COMPILER_LAUNCHER=ccache",
+                    "-DCMAKE_CXX_COMPILER_LAUNCHER=ccache",
+                ]
+            env = dict(os.environ, MAKEFLAGS=f"-j{jobs}")
+            
             result = subprocess.run(
-                ["colcon", "build", "--symlink-install"],
+                ["colcon", "build", "--symlink-install",
+                 "--parallel-workers", jobs,
+                 "--cmake-args"] + cmake_args,
                 check=True,
                 capture_output=True,
-                text=True
+                text=True,
+                env=env
             )
             
             self.logger.info("ROS workspace created and built successfully")
@@ -343,16 +358,38 @@ class SetupAutomation:
             
     def _is_package_installed(self, package_name: str) -> bool:
         """Check if a ROS package is installed"""
+        if self._installed_pkgs is None or package_name not in self._installed_pkgs:
+            packages = set(self._get_required_packages())
+            packages.add(package_name)
+            self._installed_pkgs = self._query_installed_packages(sorted(packages))
+        return self._installed_pkgs.get(package_name, False)
+        
+    def _query_installed_packages(self, packages: List[str]) -> Dict[str, bool]:
+        """
+        Look up the install state of several packages with one dpkg-query
+        
+        Args:
+            packages: Debian package names
+            
+        Returns:
+            Mapping of package name to whether it is installed
+        """
+        installed = dict.fromkeys(packages, False)
         try:
+            # Exits non-zero if any package is unknown, but still reports the rest
             result = subprocess.run(
-                ["dpkg", "-l", package_name],
+                ["dpkg-query", "-W", "-f=${Package} ${Status}\n"] + packages,
                 capture_output=True,
                 text=True,
-                timeout=5
+                timeout=10
             )
-            return result.returncode == 0
+            for line in result.stdout.splitlines():
+                name, _, status = line.partition(' ')
+                if name in installed:
+                    installed[name] = status.endswith("ok installed")
         except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+            pass
+        return installed
             
     def shutdown(self) -> None:
         """Shutdown setup module"""
@@ -6,12 +6,21 @@ Custom feature for the automation system
 """
 
 import rclpy
+import os
+import array
 import time
 import threading
 import logging
+import hashlib
+import json
 import re
-from typing import Dict, List, Optional, Callable
+from collections import OrderedDict
+from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import Dict, List, Optional, Callable, Tuple
 from pathlib import Path
+import numpy as np
 
 # ROS2 imports
 try:
@@ -24,23 +33,172 @@ except ImportError:
     String = object
     Twist = object
 
-# Voice recognition imports
+# Voice recognition; only probed here, imported by _initialize_speech_recognition
+SPEECH_RECOGNITION_AVAILABLE = find_spec('speech_recognition') is not None
+sr = None
+
+# Audio fingerprinting for the recognized-command cache; only probed here,
+# imported (with scipy) once the cache is enabled
+SPEECH_FEATURES_AVAILABLE = find_spec('python_speech_features') is not None
+mfcc = None
+
+# Local wake-word detection imports
+try:
+    import pvporcupine
+    import pyaudio
+    PORCUPINE_AVAILABLE = True
+except ImportError:
+    PORCUPINE_AVAILABLE = False
+    pvporcupine = None
+    pyaudio = None
+
+# Offline streaming recognition; only probed here, imported when the vosk
+# engine is selected
+VOSK_AVAILABLE = find_spec('vosk') is not None and find_spec('pyaudio') is not None
+vosk = None
+
+# Text-to-speech; only probed here, gtts is imported on the first synthesis
+# and playsound only if the pygame mixer is unavailable
+TTS_AVAILABLE = find_spec('gtts') is not None and find_spec('playsound') is not None
+gtts = None
+playsound = None
+
+# In-memory audio playback imports
 try:
-    import speech_recognition as sr
-    SPEECH_RECOGNITION_AVAILABLE = True
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    import pygame
+    PYGAME_AVAILABLE = True
 except ImportError:
-    SPEECH_RECOGNITION_AVAILABLE = False
-    sr = None
+    PYGAME_AVAILABLE = False
+    pygame = None
 
-# Text-to-speech imports
+# Multi-keyword location matching imports
 try:
-    import gtts
-    from playsound import playsound
-    TTS_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    TTS_AVAILABLE = False
-    gtts = None
-    playsound = None
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# JIT compilation for the per-frame voice activity loop
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+# Voice activity detection works on 20 ms frames of 16 kHz PCM
+_VAD_FRAME = 320
+_VAD_ENERGY_RATIO = 1.5   # Speech threshold relative to the measured noise floor
+_VAD_MAX_ZCR = 0.5        # Broadband noise crosses zero on about every other sample
+_VAD_HANGOVER = 1.0       # Seconds of trailing silence still fed to the recognizers
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _frame_rms(pcm, offset, length):
+        acc = 0.0
+        for i in range(length):
+            v = float(pcm[offset + i])
+            acc += v * v
+        return (acc / length) ** 0.5
+        
+    @njit(cache=True, fastmath=True)
+    def _frame_zcr(pcm, offset, length):
+        crossings = 0
+        for i in range(1, length):
+            if (pcm[offset + i - 1] >= 0) != (pcm[offset + i] >= 0):
+                crossings += 1
+        return crossings / length
+        
+    @njit(cache=True, fastmath=True)
+    def _count_speech_frames(pcm, frame_length, energy_threshold, max_zcr):
+        count = 0
+        for offset in range(0, len(pcm) - frame_length + 1, frame_length):
+            if (_frame_rms(pcm, offset, frame_length) > energy_threshold
+                    and _frame_zcr(pcm, offset, frame_length) < max_zcr):
+                count += 1
+        return count
+else:
+    def _frame_rms(pcm, offset, length):
+        frame = pcm[offset:offset + length].astype(np.float64)
+        return float(np.sqrt(np.mean(frame * frame)))
+        
+    def _count_speech_frames(pcm, frame_length, energy_threshold, max_zcr):
+        usable = len(pcm) - len(pcm) % frame_length
+        frames = pcm[:usable].reshape(-1, frame_length).astype(np.float64)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        signs = frames >= 0
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frame_length
+        return int(np.count_nonzero((rms > energy_threshold) & (zcr < max_zcr)))
+
+
+def _import_gtts() -> None:
+    """Import gTTS on first use"""
+    global gtts
+    if gtts is None:
+        import gtts
+
+
+def _import_mfcc() -> None:
+    """Import python_speech_features' MFCC on first use"""
+    global mfcc
+    if mfcc is None:
+        from python_speech_features import mfcc
+
+
+def _import_vosk() -> None:
+    """Import Vosk and PyAudio on first use"""
+    global vosk, pyaudio
+    if vosk is None:
+        import vosk
+        import pyaudio
+
+
+def _import_playsound() -> None:
+    """Import playsound on first use"""
+    global playsound
+    if playsound is None:
+        from playsound import playsound
+
+
+# Fixed phrases spoken by VoiceControl, synthesized ahead of first use
+_PROMPTS = (
+    "Voice control activated. Say 'turtlebot' followed by a command.",
+    "I'm listening",
+    "Stopping",
+    "Moving forward",
+    "Moving backward",
+    "Moving left",
+    "Moving right",
+    "Emergency stop activated",
+    "I didn't understand that command",
+    "I don't know that location",
+    "Starting exploration mode",
+    "Scanning for objects",
+    "Starting follow me mode",
+)
+
+# Command patterns with no regex syntax, matched as plain substrings
+_KEYWORD_PATTERN = re.compile(r'[\w ]+')
+
+# Recognized phrases and spoken replies used by the simulation mode
+_MOCK_COMMANDS = (
+    "turtlebot move forward",
+    "turtlebot turn left",
+    "turtlebot stop",
+    "turtlebot navigate to kitchen",
+    "turtlebot what do you see",
+    "turtlebot explore",
+)
+_MOCK_RESPONSES = (
+    "Moving forward",
+    "Turning left",
+    "Stopping robot",
+    "Navigating to kitchen",
+    "Scanning for objects",
+    "Starting exploration",
+)
 
 
 class VoiceControl(Node if 'Node' in globals() else object):
@@ -65,10 +223,61 @@ class VoiceControl(Node if 'Node' in globals() else object):
         self.recognition_engine = voice_config.get('recognition_engine', 'google')
         self.tts_engine = voice_config.get('tts_engine', 'gtts')
         self.wake_word = voice_config.get('wake_word', 'turtlebot')
+        self.microphone_index = voice_config.get('microphone_index')
+        
+        # Streaming offline recognizer, used when recognition_engine is 'vosk'
+        self.vosk_model_path = voice_config.get('vosk_model_path')
+        self._vosk_recognizer = None
+        self._vosk_audio = None
+        self._vosk_stream = None
+        
+        # Energy threshold for _is_speech, measured on the capture streams
+        self._speech_threshold = 300.0
+        
+        # On-device wake-word detection; "turtlebot" is not a built-in
+        # Porcupine keyword, so it needs a trained .ppn model file
+        self.porcupine_access_key = voice_config.get('porcupine_access_key')
+        self.wake_word_model = voice_config.get('wake_word_model')
+        self._porcupine = None
+        self._pyaudio = None
+        self._wake_stream = None
+        self._wake_silent_frames = 0
+        self.tts_language = voice_config.get('tts_language', 'en')
+        
+        # Repeated commands are matched against recent utterances by MFCC/DTW
+        # instead of another cloud STT round trip; opt-in since a false match
+        # moves the robot
+        stt_cache_config = voice_config.get('stt_cache', {})
+        self.stt_cache_enabled = (stt_cache_config.get('enabled', False)
+                                  and SPEECH_FEATURES_AVAILABLE)
+        self.stt_cache_size = stt_cache_config.get('size', 16)
+        self.stt_cache_threshold = stt_cache_config.get('threshold', 12.0)
+        self._stt_cache: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        if self.stt_cache_enabled:
+            try:
+                _import_mfcc()
+            except ImportError as e:
+                self.logger.warning(f"STT cache disabled, python_speech_features failed to import: {e}")
+                self.stt_cache_enabled = False
+        
+        # Synthesized prompts persist across runs; the dict avoids a stat per lookup
+        self._tts_cache_dir = Path(
+            voice_config.get('tts_cache_dir', '~/.cache/turtlebot_tts')
+        ).expanduser()
+        self._tts_paths: Dict[Tuple[str, str], Path] = {}
+        
+        # Encoded audio kept in memory for mixer playback from BytesIO
+        self._tts_audio: Dict[Path, bytes] = {}
+        self._mixer_ready = False
+        self._tts_lock = threading.Lock()
+        
+        # One-ahead speech pipeline: the next phrase is synthesized while the
+        # current one plays; both workers keep submission order
+        self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts_synth')
+        self._playback_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts_play')
         
         # State tracking
         self.is_listening = False
-        self.voice_active = False
         self.recognizer = None
         self.microphone = None
         
@@ -76,6 +285,20 @@ class VoiceControl(Node if 'Node' in globals() else object):
         self.cmd_vel_pub = None
         self.voice_command_pub = None
         
+        # Preallocated velocity commands: _cmd_zero is never mutated,
+        # _cmd_work is rewritten in place for each movement
+        ros_msgs_available = Twist is not object
+        self._cmd_zero = Twist() if ros_msgs_available else None
+        self._cmd_work = Twist() if ros_msgs_available else None
+        
+        # One-shot timer that ends timed movements without blocking the voice thread
+        self._stop_timer = None
+        
+        # Set while voice control is stopped; every capture loop waits on it
+        # so stop_voice_control() wakes them immediately
+        self._stop_evt = threading.Event()
+        self._stop_evt.set()
+        
         # Voice control thread
         self.voice_thread = None
         
@@ -93,28 +316,71 @@ class VoiceControl(Node if 'Node' in globals() else object):
             'emergency_stop': r'(emergency|stop).*(now|emergency)'
         }
         
-        # Navigation locations (can be extended)
-        self.locations = {
-            'kitchen': (3.0, 2.0, 0.0),
-            'living': (1.0, 1.0, 1.57),
-            'bedroom': (2.0, 3.0, -1.57),
-            'entrance': (0.0, 0.0, 0.0),
-            'home': (0.0, 0.0, 0.0)
+        # Command handlers keyed by pattern name
+        self._command_handlers: Dict[str, Callable[[str], None]] = {
+            'move_forward': lambda command: self._execute_movement('forward', 0.5, 0.0),
+            'move_backward': lambda command: self._execute_movement('backward', -0.5, 0.0),
+            'turn_left': lambda command: self._execute_movement('left', 0.0, 0.5),
+            'turn_right': lambda command: self._execute_movement('right', 0.0, -0.5),
+            'stop': lambda command: self._execute_movement('stop', 0.0, 0.0),
+            'navigate_to': self._execute_navigation_command,
+            'explore': lambda command: self._execute_exploration(),
+            'what_do_you_see': lambda command: self._execute_object_detection(),
+            'follow_me': lambda command: self._execute_follow_me(),
+            'emergency_stop': lambda command: self._execute_emergency_stop()
         }
         
+        # Compiled matchers and the generated dispatch function; rebuilt by
+        # register_command() when a command is added
+        self._compile_commands()
+        
+        # Navigation locations (can be extended), stored column-wise so
+        # nearest-location queries are a single vectorized pass. float64
+        # so get_locations() hands back exactly the poses that were set
+        self._loc_names: List[str] = []
+        self._loc_index: Dict[str, int] = {}
+        self._loc_xyz = np.empty((0, 3), dtype=np.float64)
+        for name, pose in (
+            ('kitchen', (3.0, 2.0, 0.0)),
+            ('living', (1.0, 1.0, 1.57)),
+            ('bedroom', (2.0, 3.0, -1.57)),
+            ('entrance', (0.0, 0.0, 0.0)),
+            ('home', (0.0, 0.0, 0.0))
+        ):
+            self._set_location(name, *pose)
+        self._loc_ac = None
+        self._rebuild_location_matcher()
+        
     def initialize(self) -> bool:
         """Initialize voice control module"""
         try:
             self.logger.info("Initializing voice control module")
             
-            # Check speech recognition availability
-            if not SPEECH_RECOGNITION_AVAILABLE:
-                self.logger.error("Speech recognition not available. Install with: pip install SpeechRecognition")
-                return False
+            if self.recognition_engine == 'vosk':
+                if not self._initialize_streaming_recognition():
+                    return False
+            else:
+                # Check speech recognition availability
+                if not SPEECH_RECOGNITION_AVAILABLE:
+                    self.logger.error("Speech recognition not available. Install with: pip install SpeechRecognition")
+                    return False
+                    
+                # Initialize speech recognizer
+                if not self._initialize_speech_recognition():
+                    return False
                 
-            # Initialize speech recognizer
-            if not self._initialize_speech_recognition():
-                return False
+            # Play speech from memory when a mixer is available
+            if TTS_AVAILABLE and PYGAME_AVAILABLE:
+                try:
+                    pygame.mixer.init()
+                    self._mixer_ready = True
+                except Exception as e:
+                    self.logger.warning(f"Audio mixer unavailable, falling back to playsound: {e}")
+                    
+            # Synthesize the fixed prompt set in the background so
+            # speaking is pure playback from the first command on
+            if TTS_AVAILABLE:
+                threading.Thread(target=self._presynthesize_prompts, daemon=True).start()
                 
             # Setup ROS connections if available
             if 'Node' in globals():
@@ -131,15 +397,20 @@ class VoiceControl(Node if 'Node' in globals() else object):
             
     def _initialize_speech_recognition(self) -> bool:
         """Initialize speech recognition components"""
+        global sr
         try:
+            import speech_recognition as sr
+            
             self.recognizer = sr.Recognizer()
-            self.microphone = sr.Microphone()
+            self.microphone = sr.Microphone(device_index=self.microphone_index)
             
             # Adjust for ambient noise
             with self.microphone as source:
                 self.logger.info("Adjusting for ambient noise...")
                 self.recognizer.adjust_for_ambient_noise(source, duration=2)
                 
+            self._initialize_wake_word_engine()
+            
             self.logger.info("Speech recognition initialized successfully")
             return True
             
@@ -147,6 +418,126 @@ class VoiceControl(Node if 'Node' in globals() else object):
             self.logger.error(f"Failed to initialize speech recognition: {e}")
             return False
             
+    def _initialize_streaming_recognition(self) -> bool:
+        """Open a Vosk recognizer fed directly from a 16 kHz microphone stream"""
+        if not VOSK_AVAILABLE:
+            self.logger.error("Vosk not available. Install with: pip install vosk pyaudio")
+            return False
+        if not self.vosk_model_path:
+            self.logger.error("recognition_engine 'vosk' requires voice.vosk_model_path")
+            return False
+            
+        try:
+            _import_vosk()
+            model = vosk.Model(str(Path(self.vosk_model_path).expanduser()))
+            self._vosk_recognizer = vosk.KaldiRecognizer(model, 16000)
+            self._vosk_audio = pyaudio.PyAudio()
+            self._vosk_stream = self._vosk_audio.open(
+                rate=16000,
+                channels=1,
+                format=pyaudio.paInt16,
+                input=True,
+                frames_per_buffer=4000,
+                input_device_index=self.microphone_index
+            )
+            self._calibrate_speech_threshold(self._vosk_stream, 4000, 16000)
+            self.logger.info("Streaming speech recognition initialized successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to initialize streaming speech recognition: {e}")
+            self._close_streaming_recognition()
+            return False
+            
+    def _calibrate_speech_threshold(self, stream, block: int, sample_rate: int,
+                                    duration: float = 1.0) -> None:
+        """
+        Set the speech energy threshold from the ambient noise floor
+        
+        Args:
+            stream: Open PyAudio input stream
+            block: Samples per read
+            sample_rate: Stream sample rate
+            duration: Seconds of ambient audio to measure
+        """
+        levels = []
+        for _ in range(max(1, int(duration * sample_rate / block))):
+            pcm = np.frombuffer(stream.read(block, exception_on_overflow=False), dtype=np.int16)
+            levels.append(_frame_rms(pcm, 0, len(pcm)))
+        self._speech_threshold = max(_VAD_ENERGY_RATIO * float(np.mean(levels)), 50.0)
+        self.logger.info(f"Speech energy threshold set to {self._speech_threshold:.0f}")
+        
+    def _is_speech(self, pcm: np.ndarray) -> bool:
+        """
+        Check a block of 16-bit PCM for voiced 20 ms frames
+        
+        Args:
+            pcm: int16 samples
+            
+        Returns:
+            True if any frame is above the energy threshold and below the noise ZCR
+        """
+        return _count_speech_frames(pcm, _VAD_FRAME, self._speech_threshold, _VAD_MAX_ZCR) > 0
+        
+    def _close_streaming_recognition(self) -> None:
+        """Release the Vosk audio stream"""
+        if self._vosk_stream is not None:
+            self._vosk_stream.close()
+            self._vosk_stream = None
+        if self._vosk_audio is not None:
+            self._vosk_audio.terminate()
+            self._vosk_audio = None
+        self._vosk_recognizer = None
+        
+    def _initialize_wake_word_engine(self) -> None:
+        """Set up Porcupine so the wake word is detected locally when possible"""
+        if not PORCUPINE_AVAILABLE or not self.porcupine_access_key:
+            self.logger.info("Porcupine not configured, using cloud recognition for the wake word")
+            return
+            
+        try:
+            if self.wake_word_model:
+                keyword_args = {'keyword_paths': [self.wake_word_model]}
+            elif self.wake_word in pvporcupine.KEYWORDS:
+                keyword_args = {'keywords': [self.wake_word]}
+            else:
+                self.logger.info(
+                    f"No Porcupine model for wake word '{self.wake_word}', "
+                    "using cloud recognition for the wake word"
+                )
+                return
+                
+            self._porcupine = pvporcupine.create(access_key=self.porcupine_access_key, **keyword_args)
+            self._pyaudio = pyaudio.PyAudio()
+            self._wake_stream = self._pyaudio.open(
+                rate=self._porcupine.sample_rate,
+                channels=1,
+                format=pyaudio.paInt16,
+                input=True,
+                frames_per_buffer=self._porcupine.frame_length,
+                input_device_index=self.microphone_index
+            )
+            self._calibrate_speech_threshold(
+                self._wake_stream, self._porcupine.frame_length, self._porcupine.sample_rate
+            )
+            self.logger.info("Local wake-word detection enabled")
+            
+        except Exception as e:
+            self.logger.warning(f"Could not start Porcupine, using cloud wake word: {e}")
+            self._close_wake_word_engine()
+            
+    def _close_wake_word_engine(self) -> None:
+        """Release the Porcupine handle and its audio stream"""
+        if self._wake_stream is not None:
+            self._wake_stream.close()
+            self._wake_stream = None
+        if self._pyaudio is not None:
+            self._pyaudio.terminate()
+            self._pyaudio = None
+        if self._porcupine is not None:
+            self._porcupine.delete()
+            self._porcupine = None
+            
     def _setup_ros_connections(self) -> None:
         """Setup ROS2 publishers"""
         try:
@@ -156,6 +547,10 @@ class VoiceControl(Node if 'Node' in globals() else object):
             # Voice command publisher
             self.voice_command_pub = self.create_publisher(String, '/voice_commands', 10)
             
+            # Created cancelled; reset() arms it for one period per movement
+            self._stop_timer = self.create_timer(2.0, self._auto_stop_callback)
+            self._stop_timer.cancel()
+            
             self.logger.info("ROS2 voice control connections established")
 
         except Exception as e:
@@ -175,49 +570,37 @@ class VoiceControl(Node if 'Node' in globals() else object):
         """Run mock voice command simulation"""
         import random
 
-        mock_commands = [
-            "turtlebot move forward",
-            "turtlebot turn left",
-            "turtlebot stop",
-            "turtlebot navigate to kitchen",
-            "turtlebot what do you see",
-            "turtlebot explore"
-        ]
-
-        while self.voice_active:
+        while not self._stop_evt.is_set():
             if random.random() < 0.2:  # 20% chance every few seconds
                 # Simulate hearing wake word
                 self.logger.info("🎤 Wake word detected: 'turtlebot'")
 
                 # Simulate random command
-                command = random.choice(mock_commands)
+                command = random.choice(_MOCK_COMMANDS)
                 self.logger.info(f"🎙️  Recognized command: '{command}'")
 
                 # Simulate processing
-                time.sleep(0.5)
+                if self._stop_evt.wait(0.5):
+                    break
                 self._process_voice_command(command)
 
                 # Simulate response
-                responses = [
-                    "Moving forward",
-                    "Turning left",
-                    "Stopping robot",
-                    "Navigating to kitchen",
-                    "Scanning for objects",
-                    "Starting exploration"
-                ]
-                response = random.choice(responses)
+                response = random.choice(_MOCK_RESPONSES)
                 self.logger.info(f"🗣️  Response: '{response}'")
 
-            time.sleep(random.uniform(5, 15))  # Random interval between commands
+            self._stop_evt.wait(random.uniform(5, 15))  # Random interval between commands
             
+    def start(self) -> None:
+        """Start voice control (AutomationModule interface)"""
+        self.start_voice_control()
+        
     def start_voice_control(self) -> None:
         """Start voice control system"""
         if self.voice_active:
             self.logger.warning("Voice control already active")
             return
             
-        self.voice_active = True
+        self._stop_evt.clear()
         self.logger.info("Voice control system started")
         
         # Start voice control thread
@@ -229,7 +612,7 @@ class VoiceControl(Node if 'Node' in globals() else object):
         
     def stop_voice_control(self) -> None:
         """Stop voice control system"""
-        self.voice_active = False
+        self._stop_evt.set()
         self.is_listening = False
         
         if self.voice_thread:
@@ -239,7 +622,11 @@ class VoiceControl(Node if 'Node' in globals() else object):
         
     def _voice_control_loop(self) -> None:
         """Main voice control loop"""
-        while self.voice_active:
+        if self._vosk_stream is not None:
+            self._streaming_recognition_loop()
+            return
+            
+        while not self._stop_evt.is_set():
             try:
                 # Listen for wake word
                 if self._listen_for_wake_word():
@@ -253,14 +640,78 @@ class VoiceControl(Node if 'Node' in globals() else object):
                         # Process command
                         self._process_voice_command(command)
                         
-                time.sleep(0.1)  # Brief pause between listening cycles
+                self._stop_evt.wait(0.1)  # Brief pause between listening cycles
                 
             except Exception as e:
                 self.logger.error(f"Error in voice control loop: {e}")
-                time.sleep(1.0)
+                self._stop_evt.wait(1.0)
                 
+    def _streaming_recognition_loop(self) -> None:
+        """
+        Feed microphone blocks to Vosk as they arrive
+        
+        Recognition overlaps with speech, so a command is dispatched as soon
+        as its utterance ends instead of after a fixed phrase window. The
+        wake word and command may be spoken as a single utterance.
+        """
+        recognizer = self._vosk_recognizer
+        awaiting_command = False
+        silent_blocks = 0
+        
+        while not self._stop_evt.is_set():
+            try:
+                data = self._vosk_stream.read(4000, exception_on_overflow=False)
+                
+                # Vosk needs trailing silence to close an utterance; past
+                # that, idle blocks are not worth decoding
+                if self._is_speech(np.frombuffer(data, dtype=np.int16)):
+                    silent_blocks = 0
+                else:
+                    silent_blocks += 1
+                    if silent_blocks > _VAD_HANGOVER * 16000 / 4000:
+                        continue
+                        
+                if not recognizer.AcceptWaveform(data):
+                    # Partial hypotheses surface the wake word mid-utterance
+                    if not self.is_listening:
+                        partial = json.loads(recognizer.PartialResult()).get('partial', '')
+                        if self.wake_word in partial:
+                            self.is_listening = True
+                            self.logger.info("Wake word detected")
+                    continue
+                    
+                text = json.loads(recognizer.Result()).get('text', '')
+                if self.wake_word in text:
+                    command = text.split(self.wake_word, 1)[1].strip()
+                elif awaiting_command:
+                    command = text
+                else:
+                    self.is_listening = False
+                    continue
+                    
+                if command:
+                    awaiting_command = False
+                    self.is_listening = False
+                    self.logger.info(f"Voice command received: {command}")
+                    self._process_voice_command(command)
+                else:
+                    # Wake word on its own: prompt, then drop what the
+                    # microphone picked up of our own voice
+                    awaiting_command = True
+                    self.speak("I'm listening")
+                    recognizer.Reset()
+                    
+            except Exception as e:
+                self.logger.error(f"Error in streaming recognition loop: {e}")
+                self._stop_evt.wait(1.0)
+                
+        self.is_listening = False
+        
     def _listen_for_wake_word(self) -> bool:
         """Listen for wake word"""
+        if self._porcupine is not None:
+            return self._detect_wake_word_locally()
+            
         try:
             with self.microphone as source:
                 audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=3)
@@ -278,6 +729,47 @@ class VoiceControl(Node if 'Node' in globals() else object):
             self.logger.error(f"Error listening for wake word: {e}")
             return False
             
+    def _detect_wake_word_locally(self, duration: float = 1.0) -> bool:
+        """
+        Run Porcupine over about `duration` seconds of microphone audio
+        
+        Args:
+            duration: Listening window in seconds
+            
+        Returns:
+            True if the wake word was heard
+        """
+        try:
+            frame_length = self._porcupine.frame_length
+            hangover = _VAD_HANGOVER * self._porcupine.sample_rate / frame_length
+            if self._wake_stream.is_stopped():
+                self._wake_stream.start_stream()
+                self._wake_silent_frames = 0
+                
+            for _ in range(int(duration * self._porcupine.sample_rate / frame_length)):
+                if self._stop_evt.is_set():
+                    return False
+                pcm = array.array('h')
+                pcm.frombytes(self._wake_stream.read(frame_length, exception_on_overflow=False))
+                
+                # Skip Porcupine on sustained silence
+                if self._is_speech(np.frombuffer(pcm, dtype=np.int16)):
+                    self._wake_silent_frames = 0
+                else:
+                    self._wake_silent_frames += 1
+                    if self._wake_silent_frames > hangover:
+                        continue
+                        
+                if self._porcupine.process(pcm) >= 0:
+                    # Free the device for the command recognizer
+                    self._wake_stream.stop_stream()
+                    return True
+            return False
+            
+        except Exception as e:
+            self.logger.error(f"Error in local wake-word detection: {e}")
+            return False
+            
     def _listen_for_command(self) -> Optional[str]:
         """Listen for voice command"""
         try:
@@ -287,10 +779,20 @@ class VoiceControl(Node if 'Node' in globals() else object):
                 self.logger.info("Listening for command...")
                 audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
                 
+            fingerprint = None
+            if self.stt_cache_enabled:
+                fingerprint = self._audio_fingerprint(audio)
+                text = self._lookup_stt_cache(fingerprint)
+                if text is not None:
+                    self.logger.info(f"Recognized (cached): {text}")
+                    return text
+                    
             try:
                 # Try Google speech recognition first
                 text = self.recognizer.recognize_google(audio).lower()
                 self.logger.info(f"Recognized: {text}")
+                if fingerprint is not None and self._classify_command(text):
+                    self._store_stt_cache(text, fingerprint)
                 return text
                 
             except sr.UnknownValueError:
@@ -306,6 +808,68 @@ class VoiceControl(Node if 'Node' in globals() else object):
         finally:
             self.is_listening = False
             
+    def _audio_fingerprint(self, audio) -> np.ndarray:
+        """
+        Compute a mean-normalized MFCC sequence for a captured utterance
+        
+        Args:
+            audio: SpeechRecognition AudioData
+            
+        Returns:
+            Array of shape (frames, 13)
+        """
+        samples = np.frombuffer(
+            audio.get_raw_data(convert_rate=16000, convert_width=2), dtype=np.int16
+        )
+        features = mfcc(samples, samplerate=16000, numcep=13)
+        # Cepstral mean normalization removes microphone/channel gain
+        return features - features.mean(axis=0)
+        
+    @staticmethod
+    def _dtw_distance(a: np.ndarray, b: np.ndarray) -> float:
+        """
+        Path-length normalized DTW distance between two feature sequences
+        
+        Args:
+            a: Feature sequence of shape (n, d)
+            b: Feature sequence of shape (m, d)
+            
+        Returns:
+            Average per-step frame distance along the best alignment
+        """
+        cost = np.sqrt(((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=2))
+        previous = np.cumsum(cost[0])
+        for i in range(1, len(a)):
+            row = cost[i]
+            # Diagonal/vertical steps first, then the horizontal recurrence
+            # D[j] = min(base[j], D[j-1] + row[j]) solved with a prefix scan
+            base = row + np.minimum(previous, np.concatenate(([np.inf], previous[:-1])))
+            prefix = np.cumsum(row)
+            previous = np.minimum.accumulate(base - prefix) + prefix
+        return float(previous[-1] / (len(a) + len(b)))
+        
+    def _lookup_stt_cache(self, fingerprint: np.ndarray) -> Optional[str]:
+        """Return the cached transcript closest to fingerprint, if close enough"""
+        best_text, best_distance = None, self.stt_cache_threshold
+        for text, cached in self._stt_cache.items():
+            # Utterances of very different length cannot be the same phrase
+            if not 0.5 <= len(cached) / max(len(fingerprint), 1) <= 2.0:
+                continue
+            distance = self._dtw_distance(fingerprint, cached)
+            if distance < best_distance:
+                best_text, best_distance = text, distance
+                
+        if best_text is not None:
+            self._stt_cache.move_to_end(best_text)
+        return best_text
+        
+    def _store_stt_cache(self, text: str, fingerprint: np.ndarray) -> None:
+        """Remember the latest utterance of a recognized command, evicting LRU"""
+        self._stt_cache[text] = fingerprint
+        self._stt_cache.move_to_end(text)
+        while len(self._stt_cache) > self.stt_cache_size:
+            self._stt_cache.popitem(last=False)
+            
     def _process_voice_command(self, command: str) -> None:
         """Process voice command and execute corresponding action"""
         try:
@@ -315,55 +879,153 @@ class VoiceControl(Node if 'Node' in globals() else object):
                 cmd_msg.data = command
                 self.voice_command_pub.publish(cmd_msg)
                 
-            # Check command patterns
-            if self._match_pattern(command, 'move_forward'):
-                self._execute_movement('forward', 0.5, 0.0)
-                
-            elif self._match_pattern(command, 'move_backward'):
-                self._execute_movement('backward', -0.5, 0.0)
-                
-            elif self._match_pattern(command, 'turn_left'):
-                self._execute_movement('left', 0.0, 0.5)
-                
-            elif self._match_pattern(command, 'turn_right'):
-                self._execute_movement('right', 0.0, -0.5)
-                
-            elif self._match_pattern(command, 'stop'):
-                self._execute_movement('stop', 0.0, 0.0)
-                
-            elif self._match_pattern(command, 'navigate_to'):
-                location = self._extract_location(command)
-                if location:
-                    self._execute_navigation(location)
-                else:
-                    self.speak("I don't know that location")
-                    
-            elif self._match_pattern(command, 'explore'):
-                self._execute_exploration()
-                
-            elif self._match_pattern(command, 'what_do_you_see'):
-                self._execute_object_detection()
-                
-            elif self._match_pattern(command, 'follow_me'):
-                self._execute_follow_me()
-                
-            elif self._match_pattern(command, 'emergency_stop'):
-                self._execute_emergency_stop()
-                
-            else:
-                self.speak("I didn't understand that command")
+            self._dispatch(command)
                 
         except Exception as e:
             self.logger.error(f"Error processing voice command: {e}")
             
+    def register_command(self, name: str, pattern: str,
+                         handler: Callable[[str], None]) -> None:
+        """
+        Add or replace a voice command
+        
+        New commands are matched after the built-in ones, in registration
+        order.
+        
+        Args:
+            name: Command name
+            pattern: Regular expression matched case-insensitively
+            handler: Function called with the command text on a match
+        """
+        self.command_patterns[name] = pattern
+        self._command_handlers[name] = handler
+        self._compile_commands()
+        
+    def _compile_commands(self) -> None:
+        """Rebuild the compiled patterns and dispatch function from command_patterns"""
+        self._compiled_patterns = {
+            name: self._compile_pattern(pattern)
+            for name, pattern in self.command_patterns.items()
+        }
+        
+        # Plain-keyword patterns are substring checks; the rest run as one
+        # alternation matched from the start of the command
+        self._literal_commands = {
+            name: pattern.lower()
+            for name, pattern in self.command_patterns.items()
+            if isinstance(pattern, str) and _KEYWORD_PATTERN.fullmatch(pattern)
+        }
+        
+        # Alternatives are tried in command_patterns order, so the first
+        # listed pattern wins exactly like the old if/elif chain
+        names = list(self.command_patterns)
+        regex_names = [name for name in names if name not in self._literal_commands]
+        self._combined_pattern = self._compile_alternation(regex_names)
+        
+        # A keyword hit still loses to any regex command listed before it
+        self._literal_guards = {
+            name: self._compile_alternation(
+                [other for other in regex_names if names.index(other) < names.index(name)]
+            )
+            for name in self._literal_commands
+        }
+        self._dispatch = self._build_command_dispatcher()
+        
+    @staticmethod
+    def _compile_pattern(pattern) -> re.Pattern:
+        """Compile a command pattern given as a string or an re.Pattern"""
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        return re.compile(pattern, re.IGNORECASE)
+        
+    def _build_command_dispatcher(self) -> Callable[[str], None]:
+        """
+        Generate a dispatch function with the keyword checks and handlers inlined
+        
+        The generated code follows _classify_command: keywords in priority
+        order, each guarded by the regex commands listed before it, then the
+        regex-only alternation.
+        
+        Returns:
+            Function taking the command text and running its handler
+        """
+        namespace = {
+            '_combined': self._combined_pattern,
+            '_table': self._command_handlers,
+            '_unknown': lambda: self.speak_async("I didn't understand that command"),
+        }
+        lines = ['def dispatch(command):', '    lowered = command.lower()']
+        for name, keyword in self._literal_commands.items():
+            namespace[f'h_{name}'] = self._command_handlers[name]
+            lines.append(f'    if {keyword!r} in lowered:')
+            guard = self._literal_guards[name]
+            if guard is not None:
+                namespace[f'_guard_{name}'] = guard
+                lines += [
+                    f'        m = _guard_{name}.match(command)',
+                    '        if m is not None:',
+                    '            return _table[m.lastgroup](command)',
+                ]
+            lines.append(f'        return h_{name}(command)')
+        lines += [
+            '    m = _combined.match(command)',
+            '    if m is None:',
+            '        return _unknown()',
+            '    return _table[m.lastgroup](command)',
+        ]
+        exec(compile('\n'.join(lines), '<voice_dispatch>', 'exec'), namespace)
+        return namespace['dispatch']
+        
+    def _compile_alternation(self, names: List[str]) -> Optional[re.Pattern]:
+        """Combine the named command patterns into one prioritized regex"""
+        if not names:
+            return None
+        return re.compile(
+            '|'.join(f'.*?(?P<{name}>{self._compiled_patterns[name].pattern})' for name in names),
+            re.IGNORECASE | re.DOTALL
+        )
+        
+    def _classify_command(self, command: str) -> Optional[str]:
+        """
+        Find the highest-priority command pattern matching a command
+        
+        Args:
+            command: Recognized command text
+            
+        Returns:
+            Pattern name, or None if nothing matches
+        """
+        lowered = command.lower()
+        for name, keyword in self._literal_commands.items():
+            if keyword in lowered:
+                guard = self._literal_guards[name]
+                match = guard.match(command) if guard else None
+                return match.lastgroup if match else name
+                
+        # No keyword present, so only the regex commands can match
+        match = self._combined_pattern.match(command)
+        return match.lastgroup if match else None
+        
     def _match_pattern(self, command: str, pattern_name: str) -> bool:
         """Check if command matches a pattern"""
-        pattern = self.command_patterns.get(pattern_name, '')
-        return bool(re.search(pattern, command, re.IGNORECASE))
+        pattern = self._compiled_patterns.get(pattern_name)
+        if pattern is None:
+            # Subclasses may add entries to command_patterns directly
+            pattern = self.command_patterns.get(pattern_name)
+            if pattern is None:
+                return False
+            pattern = self._compile_pattern(pattern)
+        return bool(pattern.search(command))
         
     def _extract_location(self, command: str) -> Optional[str]:
         """Extract location from navigation command"""
-        for location in self.locations.keys():
+        if self._loc_ac is not None:
+            # One pass over the command finds every location name in it
+            for _, location in self._loc_ac.iter(command):
+                return location
+            return None
+            
+        for location in self._loc_names:
             if location in command:
                 return location
         return None
@@ -371,96 +1033,224 @@ class VoiceControl(Node if 'Node' in globals() else object):
     def _execute_movement(self, direction: str, linear: float, angular: float) -> None:
         """Execute movement command"""
         if 'Node' in globals() and self.cmd_vel_pub:
-            twist = Twist()
-            twist.linear.x = linear
-            twist.angular.z = angular
-            self.cmd_vel_pub.publish(twist)
+            self._cmd_work.linear.x = linear
+            self._cmd_work.angular.z = angular
+            self.cmd_vel_pub.publish(self._cmd_work)
             
+            # Stop after a short duration for movement commands; any other
+            # command supersedes a pending stop
+            if self._stop_timer is not None:
+                if direction in ('forward', 'backward', 'left', 'right'):
+                    self._stop_timer.reset()
+                else:
+                    self._stop_timer.cancel()
+                    
         # Provide feedback
         if direction == 'stop':
-            self.speak("Stopping")
+            self.speak_async("Stopping")
         elif direction == 'emergency_stop':
-            self.speak("Emergency stop activated")
+            self.speak_async("Emergency stop activated")
         else:
-            self.speak(f"Moving {direction}")
-            
-        # Stop after a short duration for movement commands
-        if direction in ['forward', 'backward', 'left', 'right']:
-            time.sleep(2.0)
-            if self.cmd_vel_pub:
-                twist = Twist()
-                twist.linear.x = 0.0
-                twist.angular.z = 0.0
-                self.cmd_vel_pub.publish(twist)
-                
+            self.speak_async(f"Moving {direction}")
+            
+    def _auto_stop_callback(self) -> None:
+        """End a timed movement command"""
+        self._stop_timer.cancel()
+        if self.cmd_vel_pub:
+            self.cmd_vel_pub.publish(self._cmd_zero)
+            
+    def _execute_navigation_command(self, command: str) -> None:
+        """Execute a navigation command naming a known location"""
+        location = self._extract_location(command)
+        if location:
+            self._execute_navigation(location)
+        else:
+            self.speak_async("I don't know that location")
+            
     def _execute_navigation(self, location: str) -> None:
         """Execute navigation to location"""
-        if location in self.locations:
-            x, y, yaw = self.locations[location]
-            self.speak(f"Navigating to {location}")
+        if location in self._loc_index:
+            x, y, yaw = self._loc_xyz[self._loc_index[location]].tolist()
+            self.speak_async(f"Navigating to {location}")
             
             # This would integrate with the navigation module
             # For now, just log the command
-            self.logger.info(f"Navigation command: {location} -> ({x}, {y}, {yaw})")
+            self.logger.info(f"Navigation command: {location} -> ({x:.2f}, {y:.2f}, {yaw:.2f})")
         else:
-            self.speak(f"Unknown location: {location}")
+            self.speak_async(f"Unknown location: {location}")
             
     def _execute_exploration(self) -> None:
         """Execute exploration mode"""
-        self.speak("Starting exploration mode")
+        self.speak_async("Starting exploration mode")
         self.logger.info("Exploration mode activated")
         
     def _execute_object_detection(self) -> None:
         """Execute object detection query"""
-        self.speak("Scanning for objects")
+        self.speak_async("Scanning for objects")
         self.logger.info("Object detection query")
         
     def _execute_follow_me(self) -> None:
         """Execute follow me mode"""
-        self.speak("Starting follow me mode")
+        self.speak_async("Starting follow me mode")
         self.logger.info("Follow me mode activated")
         
     def _execute_emergency_stop(self) -> None:
         """Execute emergency stop"""
         if 'Node' in globals() and self.cmd_vel_pub:
-            twist = Twist()
-            twist.linear.x = 0.0
-            twist.angular.z = 0.0
-            self.cmd_vel_pub.publish(twist)
+            if self._stop_timer is not None:
+                self._stop_timer.cancel()
+            self.cmd_vel_pub.publish(self._cmd_zero)
             
-        self.speak("Emergency stop activated")
+        self.speak_async("Emergency stop activated")
         self.logger.warning("Emergency stop executed")
         
     def speak(self, text: str) -> None:
         """Convert text to speech"""
+        playback = self.speak_async(text)
+        if playback is not None:
+            # Queued behind any phrase still playing, so speech never overlaps
+            playback.result()
+            
+    def speak_async(self, text: str) -> Optional[Future]:
+        """
+        Queue text to be spoken without blocking the caller
+        
+        Synthesis runs on its own worker, so the next phrase is prepared
+        while the previous one is still playing.
+        
+        Args:
+            text: Phrase to speak
+            
+        Returns:
+            Future completing when playback ends, or None without TTS
+        """
         if not TTS_AVAILABLE:
             self.logger.info(f"TTS: {text}")
-            return
+            return None
             
+        # Play cached audio, synthesizing it only the first time
+        audio = self._tts_pool.submit(self._get_tts_audio, text, self.tts_language)
+        return self._playback_pool.submit(self._play_when_ready, audio, text)
+        
+    def _play_when_ready(self, audio: Future, text: str) -> None:
+        """Play a phrase once its synthesis future completes"""
         try:
-            # Create temporary audio file
-            tts = gtts.gTTS(text=text, lang='en')
-            temp_file = Path("/tmp/voice_output.mp3")
-            tts.save(str(temp_file))
-            
-            # Play audio
-            playsound(str(temp_file))
-            
-            # Clean up
-            temp_file.unlink()
-            
+            path = audio.result()
+            if not self._mixer_ready:
+                _import_playsound()
+                playsound(str(path))
+                return
+                
+            data = self._tts_audio.get(path)
+            if data is None:
+                data = path.read_bytes()
+                self._tts_audio[path] = data
+                
+            pygame.mixer.music.load(BytesIO(data))
+            pygame.mixer.music.play()
+            while pygame.mixer.music.get_busy():
+                time.sleep(0.01)
         except Exception as e:
             self.logger.error(f"Error in text-to-speech: {e}")
             self.logger.info(f"TTS: {text}")  # Fallback to text
             
+    def _get_tts_audio(self, text: str, lang: str) -> Path:
+        """
+        Return the mp3 for a phrase, synthesizing it with gTTS on first use
+        
+        Args:
+            text: Phrase to speak
+            lang: gTTS language code
+            
+        Returns:
+            Path to the cached audio file
+        """
+        key = (text, lang)
+        path = self._tts_paths.get(key)
+        if path is not None:
+            return path
+            
+        digest = hashlib.sha1(f"{lang}|{text}".encode()).hexdigest()
+        path = self._tts_cache_dir / f"{digest}.mp3"
+        with self._tts_lock:
+            if not path.exists():
+                self._tts_cache_dir.mkdir(parents=True, exist_ok=True)
+                # Synthesize into memory, then persist through a side file so
+                # an interrupted write is never reused
+                buffer = BytesIO()
+                _import_gtts()
+                gtts.gTTS(text=text, lang=lang).write_to_fp(buffer)
+                data = buffer.getvalue()
+                partial = path.with_suffix('.part')
+                partial.write_bytes(data)
+                partial.replace(path)
+                self._tts_audio[path] = data
+                
+        self._tts_paths[key] = path
+        return path
+        
+    def _presynthesize_prompts(self) -> None:
+        """Populate the TTS cache with every fixed prompt and known location"""
+        prompts = list(_PROMPTS)
+        prompts.extend(f"Navigating to {location}" for location in self._loc_names)
+        for text in prompts:
+            try:
+                self._get_tts_audio(text, self.tts_language)
+            except Exception as e:
+                self.logger.warning(f"Could not pre-synthesize prompt '{text}': {e}")
+                return
+        self.logger.info(f"Pre-synthesized {len(prompts)} voice prompts")
+        
     def add_location(self, name: str, x: float, y: float, yaw: float) -> None:
         """Add a new navigation location"""
-        self.locations[name] = (x, y, yaw)
+        self._set_location(name, x, y, yaw)
+        self._rebuild_location_matcher()
         self.logger.info(f"Added location: {name} -> ({x}, {y}, {yaw})")
         
+    def _set_location(self, name: str, x: float, y: float, yaw: float) -> None:
+        """Insert or overwrite a location row"""
+        index = self._loc_index.get(name)
+        if index is None:
+            self._loc_index[name] = len(self._loc_names)
+            self._loc_names.append(name)
+            self._loc_xyz = np.vstack((self._loc_xyz, np.array([[x, y, yaw]], dtype=np.float64)))
+        else:
+            self._loc_xyz[index] = (x, y, yaw)
+            
+    def _rebuild_location_matcher(self) -> None:
+        """Build the Aho-Corasick automaton over the location names"""
+        if not AHOCORASICK_AVAILABLE or not self._loc_names:
+            return
+        automaton = ahocorasick.Automaton()
+        for name in self._loc_names:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+        self._loc_ac = automaton
+        
     def get_locations(self) -> Dict[str, tuple]:
         """Get all navigation locations"""
-        return self.locations.copy()
+        return {name: tuple(row) for name, row in zip(self._loc_names, self._loc_xyz.tolist())}
+        
+    def nearest_location(self, x: float, y: float) -> Optional[str]:
+        """
+        Find the named location closest to a point
+        
+        Args:
+            x: X coordinate in the map frame
+            y: Y coordinate in the map frame
+            
+        Returns:
+            Location name, or None when no locations are defined
+        """
+        if not self._loc_names:
+            return None
+        offsets = self._loc_xyz[:, :2] - np.array((x, y), dtype=np.float64)
+        return self._loc_names[int(np.argmin(np.einsum('ij,ij->i', offsets, offsets)))]
+        
+    @property
+    def voice_active(self) -> bool:
+        """Whether voice control is running"""
+        return not self._stop_evt.is_set()
         
     def is_listening_active(self) -> bool:
         """Check if voice control is actively listening"""
@@ -470,10 +1260,9 @@ class VoiceControl(Node if 'Node' in globals() else object):
         """Run voice control (blocking)"""
         self.start_voice_control()
         try:
-            while rclpy.ok():
-                if 'Node' in globals():
-                    rclpy.spin_once(self, timeout_sec=1.0)
-                time.sleep(0.1)
+            # Recognition runs on the voice thread; spinning only services
+            # the node and blocks until shutdown
+            rclpy.spin(self)
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt")
         finally:
@@ -483,6 +1272,16 @@ class VoiceControl(Node if 'Node' in globals() else object):
         """Shutdown voice control module"""
         self.logger.info("Shutting down voice control")
         self.stop_voice_control()
+        # Drop queued phrases, then let the one playing finish before the
+        # mixer is torn down underneath it
+        self._tts_pool.shutdown(wait=False, cancel_futures=True)
+        self._playback_pool.shutdown(wait=True, cancel_futures=True)
+        self._close_wake_word_engine()
+        self._close_streaming_recognition()
+        
+        if self._mixer_ready:
+            pygame.mixer.quit()
+            self._mixer_ready = False
         
         if 'Node' in globals():
             self.destroy_node()
\ No newline at end of file
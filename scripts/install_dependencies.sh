@@ -39,6 +39,7 @@ def install_system_dependencies():
         ("sudo apt install -y python3-pip python3-venv", "Installing Python tools"),
         ("sudo apt install -y portaudio19-dev", "Installing audio dependencies"),
         ("sudo apt install -y pkg-config", "Installing build tools"),
+        ("sudo apt install -y libyaml-dev", "Installing libyaml for PyYAML's C loader"),
     ]
     
     for command, description in commands:
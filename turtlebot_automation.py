@@ -6,221 +6,531 @@ for both simulation and hardware deployment
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import importlib
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
 import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Protocol
 
 # ROS2 imports (optional)
 try:
     import rclpy
+    from rclpy.node import Node
+    from rclpy.executors import MultiThreadedExecutor, ExternalShutdownException
+    from rclpy.utilities import get_default_context
     ROS2_AVAILABLE = True
 except ImportError:
     ROS2_AVAILABLE = False
+    Node = None
     print("⚠️  ROS2 not available - running in simulation mode only")
 
+# libuv-based event loop for the simulation tasks (optional)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
+# System metrics for the maintenance simulation (optional)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    psutil = None
+
+# YAML configuration support (optional)
+try:
+    import yaml
+    YAML_AVAILABLE = True
+    # libyaml's C parser when PyYAML was built against it
+    YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+except ImportError:
+    YAML_AVAILABLE = False
+    yaml = None
+    YamlLoader = None
+
 # Import automation modules
 from modules.setup_automation import SetupAutomation
 
-# Import other modules conditionally
-try:
-    from modules.maintenance_automation import MaintenanceAutomation
-    from modules.navigation_automation import NavigationAutomation
-    from modules.object_detection import ObjectDetection
-    from modules.voice_control import VoiceControl
-    MODULES_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️  Some modules not available: {e}")
-    # Create dummy classes for missing modules
-    class MaintenanceAutomation:
-        def __init__(self, config):
-            self.logger = logging.getLogger(__name__)
-            self.is_monitoring = False
-
-        def initialize(self):
-            self.logger.info("Maintenance simulation mode initialized with mock data")
-            return True
+class _BufferedLogHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that also flushes once `interval` has passed since the last flush
 
-        def start_monitoring(self):
-            if not self.is_monitoring:
-                self.is_monitoring = True
-                self.logger.info("🩺 Starting health monitoring simulation...")
-                # Start background simulation
-                import threading
-                sim_thread = threading.Thread(target=self._run_simulation, daemon=True)
-                sim_thread.start()
-
-        def _run_simulation(self):
-            import time
-            import random
-            import psutil
-
-            while self.is_monitoring:
-                try:
-                    # Mock battery data
-                    battery_level = max(15.0, 85.0 - (time.time() % 3600) / 40.0)
-                    voltage = 11.8 * (battery_level / 100.0)
-
-                    # Mock system data
-                    try:
-                        import psutil
-                        cpu_usage = psutil.cpu_percent(interval=0.1)
-                        memory_usage = psutil.virtual_memory().percent
-                    except ImportError:
-                        cpu_usage = random.uniform(10, 30)
-                        memory_usage = random.uniform(40, 60)
-
-                    # Mock sensor data
-                    sensors_ok = random.random() > 0.1  # 90% chance sensors are ok
-
-                    self.logger.info(
-                        f"📊 Health Status - Battery: {battery_level:.1f}% ({voltage:.1f}V), "
-                        f"CPU: {cpu_usage:.1f}%, Memory: {memory_usage:.1f}%, "
-                        f"Sensors: {'OK' if sensors_ok else 'WARNING'}"
-                    )
-
-                    time.sleep(5)  # Update every 5 seconds
-
-                except Exception as e:
-                    self.logger.error(f"Simulation error: {e}")
-                    time.sleep(1)
-
-        def shutdown(self):
-            self.is_monitoring = False
-            self.logger.info("Maintenance simulation stopped")
-
-    class NavigationAutomation:
-        def __init__(self, config, sim_mode):
-            self.logger = logging.getLogger(__name__)
-            self.is_navigating = False
-
-        def initialize(self):
-            self.logger.info("Navigation simulation mode initialized")
-            return True
+    The check only runs when a record arrives; _DropReportingListener
+    flushes the buffer when its queue goes idle.
+    """
 
-        def start_navigation(self):
-            if not self.is_navigating:
-                self.is_navigating = True
-                self.logger.info("🧭 Navigation system simulation started")
-                # Start background simulation
-                import threading
-                sim_thread = threading.Thread(target=self._run_simulation, daemon=True)
-                sim_thread.start()
-
-        def _run_simulation(self):
-            import time
-            import random
-
-            while self.is_navigating:
-                if random.random() < 0.3:  # 30% chance to simulate navigation
-                    # Simulate navigation to random location
-                    x, y = random.uniform(1, 5), random.uniform(1, 5)
-                    self.logger.info(f"🚀 Starting navigation to ({x:.1f}, {y:.1f})")
-
-                    # Simulate progress
-                    for progress in [25, 50, 75, 100]:
-                        time.sleep(1)
-                        self.logger.info(f"📍 Navigation progress: {progress}% - Position: ({x*progress/100:.1f}, {y*progress/100:.1f})")
-
-                    self.logger.info(f"✅ Navigation completed! Reached target ({x:.1f}, {y:.1f})")
-
-                time.sleep(random.uniform(3, 8))
-
-        def shutdown(self):
-            self.is_navigating = False
-            self.logger.info("Navigation simulation stopped")
-
-    class ObjectDetection:
-        def __init__(self, config):
-            self.logger = logging.getLogger(__name__)
-            self.is_detecting = False
-
-        def initialize(self):
-            self.logger.info("Object detection simulation mode initialized")
-            return True
+    def __init__(self, target: logging.Handler, capacity: int = 256,
+                 flush_level: int = logging.WARNING, interval: float = 0.5):
+        super().__init__(capacity, flushLevel=flush_level, target=target)
+        self.interval = interval
+        self._last_flush = time.monotonic()
 
-        def start_detection(self):
-            if not self.is_detecting:
-                self.is_detecting = True
-                self.logger.info("🔍 Object detection simulation started")
-                # Start background simulation
-                import threading
-                sim_thread = threading.Thread(target=self._run_simulation, daemon=True)
-                sim_thread.start()
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (super().shouldFlush(record)
+                or time.monotonic() - self._last_flush >= self.interval)
 
-        def _run_simulation(self):
-            import time
-            import random
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
 
-            objects = ["person", "chair", "table", "cup", "book", "laptop", "bottle", "phone", "dog", "cat"]
 
-            while self.is_detecting:
-                if random.random() < 0.4:  # 40% chance to detect objects
-                    num_objects = random.randint(1, 3)
-                    self.logger.info(f"🔍 Detected {num_objects} object(s):")
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a bounded queue that discards the oldest record when full"""
 
-                    for i in range(num_objects):
-                        obj = random.choice(objects)
-                        confidence = random.uniform(0.7, 0.95)
-                        self.logger.info(f"  {i+1}. {obj} ({confidence:.2f} confidence)")
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
 
-                time.sleep(random.uniform(4, 10))
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped += 1
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+    def take_dropped(self) -> int:
+        """Return the number of dropped records and reset the count"""
+        # enqueue() runs under the handler lock (Handler.handle), so taking
+        # the same lock keeps a concurrent drop from being lost
+        with self.lock:
+            dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class _DropReportingListener(logging.handlers.QueueListener):
+    """QueueListener that reports records its queue handler had to drop"""
+
+    def __init__(self, log_queue: queue.Queue, *handlers, source: _DropOldestQueueHandler,
+                 flush_interval: float = 0.5, **kwargs):
+        super().__init__(log_queue, *handlers, **kwargs)
+        self._source = source
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        # Wake up whenever the queue is idle for flush_interval, so buffered
+        # file records are written even when no further record arrives
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    if isinstance(handler, _BufferedLogHandler) and handler.buffer:
+                        handler.flush()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        dropped = self._source.take_dropped() if self._source.dropped else 0
+        if dropped:
+            super().handle(logging.makeLogRecord({
+                'name': __name__, 'levelno': logging.WARNING, 'levelname': 'WARNING',
+                'msg': "Log queue full - dropped %d record(s)", 'args': (dropped,),
+            }))
+
+    def enqueue_sentinel(self) -> None:
+        # Block rather than fail when stop() finds the queue full
+        self.queue.put(self._sentinel)
+
+    def drain(self, timeout: float) -> bool:
+        """
+        Write out queued and buffered records, waiting at most `timeout` seconds
 
-        def shutdown(self):
-            self.is_detecting = False
-            self.logger.info("Object detection simulation stopped")
+        Returns:
+            True if everything was written, False if the sink stalled
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            self.queue.put(self._sentinel, timeout=timeout)
+        except queue.Full:
+            return False
+        self._thread.join(max(0.0, deadline - time.monotonic()))
+        if self._thread.is_alive():
+            return False
+        self._thread = None
+        for handler in self.handlers:
+            handler.flush()
+        return True
+
+
+def _merge_config(defaults: dict, overrides: dict) -> dict:
+    """Recursively overlay a parsed config file onto the default config"""
+    merged = dict(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
 
-    class VoiceControl:
-        def __init__(self, config):
-            self.logger = logging.getLogger(__name__)
-            self.is_listening = False
 
-        def initialize(self):
-            self.logger.info("Voice control simulation mode initialized")
-            return True
+# Event loop hosting simulation tasks started outside a running loop
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _schedule_simulation(coro):
+    """
+    Run a simulation coroutine on the current event loop, or on a shared
+    background loop when called from plain (executor-driven) code
+    
+    Returns:
+        asyncio.Task or concurrent.futures.Future; both support cancel()
+    """
+    global _background_loop
+    try:
+        return asyncio.get_running_loop().create_task(coro)
+    except RuntimeError:
+        pass
+    if _background_loop is None:
+        _background_loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        threading.Thread(target=_background_loop.run_forever, daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop)
 
-        def start_voice_control(self):
-            if not self.is_listening:
-                self.is_listening = True
-                self.logger.info("🎤 Voice control simulation started - listening for commands")
-                # Start background simulation
-                import threading
-                sim_thread = threading.Thread(target=self._run_simulation, daemon=True)
-                sim_thread.start()
 
-        def _run_simulation(self):
-            import time
-            import random
+def _interval_deck(rng: random.Random, low: float, high: float, size: int = 256):
+    """Yield uniform sleep intervals, sampled from rng in batches of size"""
+    while True:
+        yield from [rng.uniform(low, high) for _ in range(size)]
 
-            commands = [
-                ("move forward", "Moving forward"),
-                ("turn left", "Turning left"),
-                ("stop", "Stopping robot"),
-                ("navigate to kitchen", "Navigating to kitchen"),
-                ("what do you see", "Scanning environment"),
-                ("explore", "Starting exploration mode")
-            ]
 
-            while self.is_listening:
-                if random.random() < 0.25:  # 25% chance to simulate voice command
-                    command, response = random.choice(commands)
-                    self.logger.info(f"🎙️  Heard: '{command}'")
-                    time.sleep(0.5)
-                    self.logger.info(f"🗣️  Response: '{response}'")
+class _PrefixAdapter(logging.LoggerAdapter):
+    """Prepend a fixed prefix to messages; applied only to records that pass the level check"""
 
-                time.sleep(random.uniform(6, 15))
+    def process(self, msg, kwargs):
+        return f"{self.extra['prefix']} {msg}", kwargs
 
-        def shutdown(self):
-            self.is_listening = False
-            self.logger.info("Voice control simulation stopped")
 
-    MODULES_AVAILABLE = False
+# Prefixed loggers for the recurring simulation events
+_sim_logger = logging.getLogger(__name__)
+_health_log = _PrefixAdapter(_sim_logger, {'prefix': '📊'})
+_goal_log = _PrefixAdapter(_sim_logger, {'prefix': '🚀'})
+_detection_log = _PrefixAdapter(_sim_logger, {'prefix': '🔍'})
+_heard_log = _PrefixAdapter(_sim_logger, {'prefix': '🎙️ '})
+_response_log = _PrefixAdapter(_sim_logger, {'prefix': '🗣️ '})
+
+
+class AutomationModule(Protocol):
+    """Interface shared by every automation module and its simulation stand-in"""
+
+    def initialize(self) -> bool:
+        """Prepare the module; False means it continues in simulation mode"""
+
+    def start(self) -> None:
+        """Start the module as part of full automation (non-blocking)"""
+
+    def run(self) -> None:
+        """Run the module on its own, as for --module"""
+
+    def shutdown(self) -> None:
+        """Stop the module and release its resources"""
+
+
+# Simulation stand-ins used when a module's dependencies are missing.
+# Their loops are coroutines sharing one event loop instead of a thread each,
+# and each draws from its own random.Random so no generator lock is shared
+class SimulatedMaintenanceAutomation:
+    __slots__ = ('logger', 'is_monitoring', 'simulation_task', '_rng')
+
+    def __init__(self, config):
+        self.logger = logging.getLogger(__name__)
+        self.is_monitoring = False
+        self.simulation_task = None
+        self._rng = random.Random()
+
+    def initialize(self):
+        self.logger.info("Maintenance simulation mode initialized with mock data")
+        return True
+
+    def start(self):
+        if not self.is_monitoring:
+            self.is_monitoring = True
+            self.logger.info("🩺 Starting health monitoring simulation...")
+            if PSUTIL_AVAILABLE:
+                # Prime the counters; later non-blocking calls report the
+                # usage since the previous call
+                psutil.cpu_percent(interval=None)
+            # Start background simulation
+            self.simulation_task = _schedule_simulation(self._run_simulation())
+
+    async def _run_simulation(self):
+        # Sleep to absolute deadlines so tick work does not add to the period
+        next_tick = time.monotonic()
+        while self.is_monitoring:
+            try:
+                # Mock battery data
+                battery_level = max(15.0, 85.0 - (time.time() % 3600) / 40.0)
+                voltage = 11.8 * (battery_level / 100.0)
+
+                # Mock system data
+                if PSUTIL_AVAILABLE:
+                    cpu_usage = psutil.cpu_percent(interval=None)
+                    memory_usage = psutil.virtual_memory().percent
+                else:
+                    cpu_usage = self._rng.uniform(10, 30)
+                    memory_usage = self._rng.uniform(40, 60)
+
+                # Mock sensor data
+                sensors_ok = self._rng.random() > 0.1  # 90% chance sensors are ok
+
+                _health_log.info(
+                    "Health Status - Battery: %.1f%% (%.1fV), CPU: %.1f%%, Memory: %.1f%%, Sensors: %s",
+                    battery_level, voltage, cpu_usage, memory_usage, 'OK' if sensors_ok else 'WARNING'
+                )
+
+                next_tick += 5.0  # Update every 5 seconds
+                await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+            except Exception as e:
+                self.logger.error(f"Simulation error: {e}")
+                await asyncio.sleep(1)
+                next_tick = time.monotonic()
+
+    def shutdown(self):
+        self.is_monitoring = False
+        if self.simulation_task is not None:
+            self.simulation_task.cancel()
+            self.simulation_task = None
+        self.logger.info("Maintenance simulation stopped")
+
+    # Running a stand-in on its own just starts its simulation
+    run = start
+    start_monitoring = start
+
+
+class SimulatedNavigationAutomation:
+    __slots__ = ('logger', 'is_navigating', 'simulation_task', '_rng', '_intervals')
+
+    def __init__(self, config, sim_mode):
+        self.logger = logging.getLogger(__name__)
+        self.is_navigating = False
+        self.simulation_task = None
+        self._rng = random.Random()
+        self._intervals = _interval_deck(self._rng, 3, 8)
+
+    def initialize(self):
+        self.logger.info("Navigation simulation mode initialized")
+        return True
+
+    def start(self):
+        if not self.is_navigating:
+            self.is_navigating = True
+            self.logger.info("🧭 Navigation system simulation started")
+            # Start background simulation
+            self.simulation_task = _schedule_simulation(self._run_simulation())
+
+    async def _run_simulation(self):
+        while self.is_navigating:
+            if self._rng.random() < 0.3:  # 30% chance to simulate navigation
+                # Simulate navigation to random location
+                x, y = self._rng.uniform(1, 5), self._rng.uniform(1, 5)
+                _goal_log.info("Starting navigation to (%.1f, %.1f)", x, y)
+
+                # Simulate progress, reported as one record per navigation
+                parts = []
+                for progress in (25, 50, 75, 100):
+                    await asyncio.sleep(1)
+                    parts.append(f"  📍 {progress}% - Position: ({x*progress/100:.1f}, {y*progress/100:.1f})")
+
+                parts.append(f"  ✅ Navigation completed! Reached target ({x:.1f}, {y:.1f})")
+                _sim_logger.info("Navigation to (%.1f, %.1f):\n%s", x, y, "\n".join(parts))
+
+            await asyncio.sleep(next(self._intervals))
+
+    def shutdown(self):
+        self.is_navigating = False
+        if self.simulation_task is not None:
+            self.simulation_task.cancel()
+            self.simulation_task = None
+        self.logger.info("Navigation simulation stopped")
+
+    # Running a stand-in on its own just starts its simulation
+    run = start
+    start_navigation = start
+
+
+class SimulatedObjectDetection:
+    OBJECTS = ("person", "chair", "table", "cup", "book", "laptop", "bottle", "phone", "dog", "cat")
+
+    __slots__ = ('logger', 'is_detecting', 'simulation_task', '_rng', '_intervals')
+
+    def __init__(self, config):
+        self.logger = logging.getLogger(__name__)
+        self.is_detecting = False
+        self.simulation_task = None
+        self._rng = random.Random()
+        self._intervals = _interval_deck(self._rng, 4, 10)
+
+    def initialize(self):
+        self.logger.info("Object detection simulation mode initialized")
+        return True
+
+    def start(self):
+        if not self.is_detecting:
+            self.is_detecting = True
+            self.logger.info("🔍 Object detection simulation started")
+            # Start background simulation
+            self.simulation_task = _schedule_simulation(self._run_simulation())
+
+    async def _run_simulation(self):
+        while self.is_detecting:
+            if self._rng.random() < 0.4:  # 40% chance to detect objects
+                num_objects = self._rng.randint(1, 3)
+                found = "; ".join(
+                    f"{self._rng.choice(self.OBJECTS)} ({self._rng.uniform(0.7, 0.95):.2f})"
+                    for _ in range(num_objects)
+                )
+                _detection_log.info("Detected %d object(s): %s", num_objects, found)
+
+            await asyncio.sleep(next(self._intervals))
+
+    def shutdown(self):
+        self.is_detecting = False
+        if self.simulation_task is not None:
+            self.simulation_task.cancel()
+            self.simulation_task = None
+        self.logger.info("Object detection simulation stopped")
+
+    # Running a stand-in on its own just starts its simulation
+    run = start
+    start_detection = start
+
+
+class SimulatedVoiceControl:
+    COMMANDS = (
+        ("move forward", "Moving forward"),
+        ("turn left", "Turning left"),
+        ("stop", "Stopping robot"),
+        ("navigate to kitchen", "Navigating to kitchen"),
+        ("what do you see", "Scanning environment"),
+        ("explore", "Starting exploration mode"),
+    )
+
+    __slots__ = ('logger', 'is_listening', 'simulation_task', '_rng', '_intervals')
+
+    def __init__(self, config):
+        self.logger = logging.getLogger(__name__)
+        self.is_listening = False
+        self.simulation_task = None
+        self._rng = random.Random()
+        self._intervals = _interval_deck(self._rng, 6, 15)
+
+    def initialize(self):
+        self.logger.info("Voice control simulation mode initialized")
+        return True
+
+    def start(self):
+        if not self.is_listening:
+            self.is_listening = True
+            self.logger.info("🎤 Voice control simulation started - listening for commands")
+            # Start background simulation
+            self.simulation_task = _schedule_simulation(self._run_simulation())
+
+    async def _run_simulation(self):
+        while self.is_listening:
+            if self._rng.random() < 0.25:  # 25% chance to simulate voice command
+                command, response = self._rng.choice(self.COMMANDS)
+                _heard_log.info("Heard: '%s'", command)
+                await asyncio.sleep(0.5)
+                _response_log.info("Response: '%s'", response)
+
+            await asyncio.sleep(next(self._intervals))
+
+    def shutdown(self):
+        self.is_listening = False
+        if self.simulation_task is not None:
+            self.simulation_task.cancel()
+            self.simulation_task = None
+        self.logger.info("Voice control simulation stopped")
+
+    # Running a stand-in on its own just starts its simulation
+    run = start
+    start_voice_control = start
+
+
+# Real module classes are imported on first use, so a single-module run only
+# pays for the dependencies of the module it starts
+_MODULE_CLASSES = {
+    'maintenance': ('modules.maintenance_automation', 'MaintenanceAutomation', SimulatedMaintenanceAutomation),
+    'navigation': ('modules.navigation_automation', 'NavigationAutomation', SimulatedNavigationAutomation),
+    'detection': ('modules.object_detection', 'ObjectDetection', SimulatedObjectDetection),
+    'voice': ('modules.voice_control', 'VoiceControl', SimulatedVoiceControl),
+}
+
+# Names used in log lines, computed once
+_DISPLAY_NAMES = {name: name.capitalize() for name in ('setup', *_MODULE_CLASSES)}
+
+# Modules that must finish initialize() before a module's own initialize()
+# runs; everything else in a layer initializes concurrently
+_MODULE_DEPS = {
+    'setup': (),
+    'maintenance': ('setup',),
+    'navigation': ('setup',),
+    'detection': ('setup',),
+    'voice': ('setup',),
+}
+
+
+class ModuleCycleError(RuntimeError):
+    """Raised when _MODULE_DEPS contains a dependency cycle"""
+
+
+def _init_layers(names) -> list:
+    """
+    Group modules into initialization layers (Kahn's algorithm)
+    
+    Args:
+        names: Modules being initialized; dependencies on modules
+            outside this set are ignored
+            
+    Returns:
+        List of layers, each a list of names whose dependencies all sit
+        in earlier layers
+    """
+    pending = {name: {dep for dep in _MODULE_DEPS.get(name, ()) if dep in names} for name in names}
+    layers = []
+    while pending:
+        ready = [name for name, deps in pending.items() if not deps]
+        if not ready:
+            raise ModuleCycleError(f"Module dependency cycle among: {', '.join(pending)}")
+        for name in ready:
+            del pending[name]
+        for deps in pending.values():
+            deps.difference_update(ready)
+        layers.append(ready)
+    return layers
 
 
 class TurtleBotAutomation:
     """Main automation orchestrator for TurtleBot3"""
     
+    __slots__ = (
+        'logger', 'simulation_mode', 'config', 'modules',
+        'ros_context', 'executor',
+        '_log_listener', '_log_queue_handler', '_stop_event', '_shutdown_lock',
+    )
+    
     def __init__(self, config_file: Optional[str] = None, simulation_mode: bool = True):
         """
         Initialize TurtleBot3 automation system
@@ -229,26 +539,47 @@ class TurtleBotAutomation:
             config_file: Path to configuration file
             simulation_mode: True for simulation, False for hardware
         """
+        self._log_listener = None
         self.logger = self._setup_logging()
         self.simulation_mode = simulation_mode
         self.config = self._load_config(config_file)
-        self.modules: Dict[str, object] = {}
+        self.modules: Dict[str, AutomationModule] = {}
         self.ros_context = None
+        self.executor = None
+        self._stop_event: Optional[asyncio.Event] = None
+        # Held forever by the first shutdown() call
+        self._shutdown_lock = threading.Lock()
         
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # SIGTERM unwinds like Ctrl+C, so shutdown runs from the normal
+        # finally blocks instead of inside a signal handler
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
         
     def _setup_logging(self) -> logging.Logger:
         """Configure logging system"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('turtlebot_automation.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler('turtlebot_automation.log')
+        stream_handler = logging.StreamHandler(sys.stdout)
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(formatter)
+            
+        # File writes are batched: one write per 256 records, per 0.5 s of
+        # traffic, or immediately for warnings and errors
+        handlers = [_BufferedLogHandler(file_handler), stream_handler]
+        
+        # Callers still merge the message arguments and render any traceback
+        # (QueueHandler.prepare); the line format with its timestamp and the
+        # file/tty writes happen on the listener thread. The queue is bounded
+        # so a stalled sink (slow SD card) drops the oldest records instead
+        # of growing
+        log_queue = queue.Queue(maxsize=2048)
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+        self._log_queue_handler = _DropOldestQueueHandler(log_queue)
+        root.addHandler(self._log_queue_handler)
+        self._log_listener = _DropReportingListener(
+            log_queue, *handlers, source=self._log_queue_handler, respect_handler_level=True
         )
+        self._log_listener.start()
         return logging.getLogger(__name__)
         
     def _load_config(self, config_file: Optional[str]) -> dict:
@@ -268,7 +599,11 @@ class TurtleBotAutomation:
             'detection': {
                 'model_path': 'yolov8n.pt',
                 'confidence': 0.5,
-                'camera_topic': '/camera/image_raw'
+                'camera_topic': '/camera/image_raw',
+                'qos_profile': 'sensor_data',
+                'backend': 'auto',
+                'device': 'auto',
+                'precision': None
             },
             'voice': {
                 'recognition_engine': 'google',
@@ -283,13 +618,59 @@ class TurtleBotAutomation:
         }
         
         if config_file and Path(config_file).exists():
-            # TODO: Implement YAML config loading
             self.logger.info(f"Loading config from {config_file}")
+            if not YAML_AVAILABLE:
+                self.logger.warning("PyYAML not available, using default configuration")
+                return default_config
+                
+            # Parsed once here; modules copy the values they need into
+            # attributes at construction, so nothing re-reads the dict later
+            try:
+                return _merge_config(default_config, self._read_config_file(Path(config_file)))
+            except (OSError, yaml.YAMLError) as e:
+                self.logger.error(f"Failed to load config {config_file}: {e}")
         else:
             self.logger.info("Using default configuration")
             
         return default_config
         
+    def _read_config_file(self, path: Path) -> dict:
+        """
+        Parse a YAML config file, reusing a JSON copy of the last parse
+        
+        The copy lives in the user cache directory ($XDG_CACHE_HOME or
+        ~/.cache), since installed configs sit in a read-only share
+        directory, and is only used while the YAML file's mtime and size
+        match the ones it records.
+        """
+        stat = path.stat()
+        key = [stat.st_mtime_ns, stat.st_size]
+        cache_dir = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'turtlebot_automation'
+        digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:16]
+        cache_path = cache_dir / f"{path.stem}-{digest}.json"
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached.get('key') == key:
+                return cached['config']
+        except (OSError, ValueError, AttributeError):
+            pass
+            
+        with open(path, 'rb') as f:
+            parsed = yaml.load(f, Loader=YamlLoader) or {}
+            
+        # Skipped for an unwritable cache directory and for values (dates,
+        # non-string keys) that would not survive a JSON round trip; either
+        # way the next run just parses the YAML again
+        try:
+            text = json.dumps({'key': key, 'config': parsed})
+            if json.loads(text)['config'] == parsed:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(text)
+        except (OSError, TypeError, ValueError):
+            pass
+        return parsed
+        
     def initialize_ros(self) -> bool:
         """Initialize ROS2 context and nodes"""
         if not ROS2_AVAILABLE:
@@ -297,9 +678,19 @@ class TurtleBotAutomation:
             return False
 
         try:
-            if not rclpy.ok():
-                rclpy.init()
-                self.ros_context = rclpy.Context()
+            # rclpy has no intra-process transport; Fast DDS data sharing is
+            # the zero-copy path between the module nodes in this process
+            # and same-host camera drivers. Must be set before any node exists
+            if self.config.get('system', {}).get('shared_memory_transport', True):
+                os.environ.setdefault(
+                    'FASTRTPS_DEFAULT_PROFILES_FILE',
+                    str(Path(__file__).resolve().parent / 'config' / 'fastdds_shm_profile.xml')
+                )
+                
+            # Module nodes, their run() loops and spin helpers all use the
+            # default context, so that is the one (and only) context to init
+            self.ros_context = get_default_context()
+            if not self.ros_context.ok():
                 rclpy.init(context=self.ros_context)
 
             self.logger.info("ROS2 initialized successfully")
@@ -308,27 +699,53 @@ class TurtleBotAutomation:
             self.logger.error(f"Failed to initialize ROS2: {e}")
             return False
             
-    def initialize_modules(self) -> bool:
-        """Initialize all automation modules"""
+    def _load_module_class(self, name: str) -> type:
+        """Import a module's class, falling back to its simulation stand-in"""
+        module_path, class_name, simulated = _MODULE_CLASSES[name]
+        try:
+            return getattr(importlib.import_module(module_path), class_name)
+        except ImportError as e:
+            self.logger.warning(f"{class_name} not available ({e}) - using simulation")
+            return simulated
+            
+    def initialize_modules(self, only: Optional[str] = None) -> bool:
+        """
+        Initialize automation modules
+        
+        Args:
+            only: Name of the single module to create, or None for all
+        """
         try:
             self.logger.info("Initializing automation modules...")
 
             # Initialize modules based on configuration
-            self.modules['setup'] = SetupAutomation(self.config, self.simulation_mode)
-            self.modules['maintenance'] = MaintenanceAutomation(self.config)
-            self.modules['navigation'] = NavigationAutomation(self.config, self.simulation_mode)
-            self.modules['detection'] = ObjectDetection(self.config)
-            self.modules['voice'] = VoiceControl(self.config)
-
-            # Initialize each module
-            for name, module in self.modules.items():
-                if hasattr(module, 'initialize'):
-                    success = module.initialize()
-                    if not success:
-                        self.logger.warning(f"Failed to initialize {name} module - continuing in simulation mode")
-                        # Don't return False, continue with other modules
-                    else:
-                        self.logger.info(f"{name.capitalize()} module initialized")
+            names = [only] if only else ['setup', *_MODULE_CLASSES]
+            for name in names:
+                if name == 'setup':
+                    self.modules['setup'] = SetupAutomation(self.config, self.simulation_mode)
+                elif name == 'navigation':
+                    self.modules[name] = self._load_module_class(name)(self.config, self.simulation_mode)
+                elif name in _MODULE_CLASSES:
+                    self.modules[name] = self._load_module_class(name)(self.config)
+
+            # Initialize layer by layer in dependency order; modules within a
+            # layer run concurrently, since model loads and engine warm-ups
+            # are mostly I/O
+            layers = _init_layers(self.modules)
+            with ThreadPoolExecutor(max_workers=max(map(len, layers), default=1),
+                                    thread_name_prefix='module_init') as pool:
+                for layer in layers:
+                    # Report each module as soon as it finishes rather than
+                    # behind the slowest one in its layer
+                    pending = {pool.submit(self.modules[name].initialize): name for name in layer}
+                    for future in as_completed(pending):
+                        name = pending[future]
+                        success = future.result()
+                        if not success:
+                            self.logger.warning(f"Failed to initialize {name} module - continuing in simulation mode")
+                            # Don't return False, continue with other modules
+                        else:
+                            self.logger.info("%s module initialized", _DISPLAY_NAMES[name])
 
             self.logger.info("Module initialization completed")
             return True
@@ -348,39 +765,19 @@ class TurtleBotAutomation:
             self.logger.info("Starting full automation pipeline...")
 
             # Run setup if needed
-            if hasattr(self.modules['setup'], 'needs_setup') and self.modules['setup'].needs_setup():
-                self.logger.info("Running setup automation...")
-                if hasattr(self.modules['setup'], 'run_setup'):
-                    self.modules['setup'].run_setup()
-
-            # Start maintenance monitoring
-            if hasattr(self.modules['maintenance'], 'start_monitoring'):
-                self.modules['maintenance'].start_monitoring()
-
-            # Start navigation system
-            if hasattr(self.modules['navigation'], 'start_navigation'):
-                self.modules['navigation'].start_navigation()
-
-            # Start object detection
-            if hasattr(self.modules['detection'], 'start_detection'):
-                self.modules['detection'].start_detection()
-
-            # Start voice control
-            if hasattr(self.modules['voice'], 'start_voice_control'):
-                self.modules['voice'].start_voice_control()
+            self.modules['setup'].start()
 
             # Keep the system running
-            self.logger.info("Full automation system is running...")
-            if ros_available:
+            if ros_available and self._create_executor():
+                self._start_modules()
+                self.logger.info("Full automation system is running...")
                 self._run_main_loop()
             else:
                 self.logger.info("Running in simulation mode - press Ctrl+C to exit")
-                import time
-                try:
-                    while True:
-                        time.sleep(1)
-                except KeyboardInterrupt:
-                    pass
+                if UVLOOP_AVAILABLE:
+                    uvloop.run(self._run_simulation())
+                else:
+                    asyncio.run(self._run_simulation())
 
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt")
@@ -389,6 +786,39 @@ class TurtleBotAutomation:
         finally:
             self.shutdown()
             
+    def _start_modules(self) -> None:
+        """Start every long-running module"""
+        # Maintenance, navigation, detection, then voice control
+        for name in _MODULE_CLASSES:
+            self.modules[name].start()
+            
+    async def _run_simulation(self) -> None:
+        """Start the modules on this event loop and run them until SIGINT/SIGTERM"""
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._request_stop, signum)
+            
+        self._start_modules()
+        self.logger.info("Full automation system is running...")
+        
+        await self._stop_event.wait()
+        # Stop the modules while their simulation tasks' loop is still running
+        self._shutdown_modules()
+        
+    def _request_stop(self, signum: int) -> None:
+        """Signal handler for the simulation loop; only wakes _run_simulation"""
+        if self._stop_event.is_set():
+            # Second signal while shutting down: give up on a clean exit
+            self.logger.warning(f"Received signal {signum} again, exiting immediately")
+            # os._exit() skips atexit and the listener, so write queued
+            # records out first unless the sink is stalled
+            if self._log_listener is not None:
+                self._log_listener.drain(timeout=2.0)
+            os._exit(1)
+        self.logger.info(f"Received signal {signum}, shutting down...")
+        self._stop_event.set()
+        
     def run_individual_module(self, module_name: str) -> None:
         """Run specific automation module"""
         # For setup module, allow running even without ROS2
@@ -399,8 +829,8 @@ class TurtleBotAutomation:
             # Initialize ROS context check but don't fail if not available
             self.initialize_ros()
 
-        # Initialize modules
-        if not self.initialize_modules():
+        # Initialize only the requested module
+        if not self.initialize_modules(only=module_name):
             return
 
         if module_name not in self.modules:
@@ -409,70 +839,88 @@ class TurtleBotAutomation:
             
         try:
             self.logger.info(f"Running {module_name} module...")
-            module = self.modules[module_name]
-            
-            if hasattr(module, 'run'):
-                module.run()
-            elif hasattr(module, 'run_setup'):
-                module.run_setup()
-            elif hasattr(module, 'start_monitoring'):
-                module.start_monitoring()
-            elif hasattr(module, 'start_navigation'):
-                module.start_navigation()
-            elif hasattr(module, 'start_detection'):
-                module.start_detection()
-            elif hasattr(module, 'start_voice_control'):
-                module.start_voice_control()
-            else:
-                self.logger.error(f"Module {module_name} has no run method")
+            self.modules[module_name].run()
                 
         except Exception as e:
             self.logger.error(f"Error running {module_name}: {e}")
         finally:
             self.shutdown()
             
+    def _create_executor(self) -> bool:
+        """
+        Attach every module node to one shared executor
+        
+        Returns:
+            True if at least one node was added
+        """
+        self.executor = MultiThreadedExecutor(num_threads=max(4, os.cpu_count() or 1))
+        for module in self.modules.values():
+            # Nodes are either the module itself or held as module.node
+            node = module if isinstance(module, Node) else getattr(module, 'node', None)
+            if isinstance(node, Node):
+                self.executor.add_node(node)
+                
+        if not self.executor.get_nodes():
+            self.logger.warning("No ROS2 nodes to spin")
+            self.executor.shutdown()
+            self.executor = None
+            return False
+        return True
+        
     def _run_main_loop(self) -> None:
         """Main execution loop"""
+        # Blocks in the executor's wait set; health checks run as a timer
+        # on the maintenance node instead of being polled here
         try:
-            while rclpy.ok():
-                # Process ROS callbacks
-                rclpy.spin_once(timeout_sec=0.1)
-                
-                # Check system health
-                if not self.modules['maintenance'].is_healthy():
-                    self.logger.warning("System health check failed")
-                    
+            self.executor.spin()
+        except ExternalShutdownException:
+            pass
         except Exception as e:
             self.logger.error(f"Error in main loop: {e}")
             
-    def _signal_handler(self, signum, frame):
-        """Handle shutdown signals"""
-        self.logger.info(f"Received signal {signum}, shutting down...")
-        self.shutdown()
-        sys.exit(0)
-        
+    def _shutdown_modules(self) -> None:
+        """Shut down every module once; later calls find nothing left to stop"""
+        modules, self.modules = self.modules, {}
+        for name, module in modules.items():
+            try:
+                module.shutdown()
+                self.logger.info("%s module shutdown", _DISPLAY_NAMES[name])
+            except Exception as e:
+                self.logger.error(f"Error shutting down {name}: {e}")
+                
     def shutdown(self) -> None:
-        """Graceful shutdown of all systems"""
+        """Graceful shutdown of all systems; only the first call does anything"""
+        if not self._shutdown_lock.acquire(blocking=False):
+            return
         self.logger.info("Shutting down TurtleBot3 automation...")
 
         # Shutdown all modules
-        for name, module in self.modules.items():
-            try:
-                if hasattr(module, 'shutdown'):
-                    module.shutdown()
-                    self.logger.info(f"{name.capitalize()} module shutdown")
-            except Exception as e:
-                self.logger.error(f"Error shutting down {name}: {e}")
+        self._shutdown_modules()
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
 
         # Shutdown ROS2
-        if ROS2_AVAILABLE and rclpy.ok():
-            rclpy.shutdown()
+        if self.ros_context is not None and self.ros_context.ok():
+            rclpy.shutdown(context=self.ros_context)
 
         self.logger.info("TurtleBot3 automation shutdown complete")
 
+        # Flush queued records, then log directly for anything after shutdown
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            root = logging.getLogger()
+            root.removeHandler(self._log_queue_handler)
+            for handler in self._log_listener.handlers:
+                handler.flush()
+                root.addHandler(handler)
+            self._log_listener = None
 
-def main():
-    """Main entry point"""
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process"""
     parser = argparse.ArgumentParser(
         description='TurtleBot3 Comprehensive Automation System',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -516,8 +964,17 @@ Examples:
         action='store_true',
         help='Enable verbose logging'
     )
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point"""
+    # No arguments is the all-defaults run; skip building the parser
+    if len(sys.argv) == 1:
+        TurtleBotAutomation().run_full_automation()
+        return
+        
+    args = _build_parser().parse_args()
     
     # Set logging level
     if args.verbose: